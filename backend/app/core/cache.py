@@ -0,0 +1,62 @@
+import asyncio
+from itertools import chain
+from typing import Awaitable, Callable, TypeVar
+
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_T = TypeVar("_T")
+
+
+class WriteVersionedCache:
+    """In-process TTL cache for read endpoints, invalidated by writes to ``models``.
+
+    Entries are keyed by a data version that is bumped after every commit that
+    inserted, updated or deleted rows of the watched models (through the unit of
+    work or an ORM-enabled INSERT/UPDATE/DELETE statement), so a change is visible on the next read instead
+    of after the TTL. Writes made by other processes only show up once entries expire.
+    """
+
+    def __init__(self, *models: type, ttl: float, maxsize: int = 256) -> None:
+        self._models = models
+        self._dirty_flag = f"write_versioned_cache_{id(self)}"
+        self._entries: "TTLCache[tuple, object]" = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._locks: "TTLCache[tuple, asyncio.Lock]" = TTLCache(maxsize=maxsize, ttl=ttl * 4)
+        self._version = 0
+
+        event.listen(Session, "after_flush", self._note_flush)
+        event.listen(Session, "do_orm_execute", self._note_bulk_write)
+        event.listen(Session, "after_commit", self._bump_version)
+        event.listen(Session, "after_rollback", self._forget_changes)
+
+    def _note_flush(self, session: Session, _flush_context) -> None:  # noqa: ANN001 - SQLAlchemy event signature
+        if any(isinstance(obj, self._models) for obj in chain(session.new, session.dirty, session.deleted)):
+            session.info[self._dirty_flag] = True
+
+    def _note_bulk_write(self, state) -> None:  # noqa: ANN001 - SQLAlchemy event signature
+        if (state.is_insert or state.is_update or state.is_delete) and state.bind_mapper is not None and state.bind_mapper.class_ in self._models:
+            state.session.info[self._dirty_flag] = True
+
+    def _bump_version(self, session: Session) -> None:
+        if session.info.pop(self._dirty_flag, False):
+            self._version += 1
+
+    def _forget_changes(self, session: Session) -> None:
+        session.info.pop(self._dirty_flag, None)
+
+    async def get_or_compute(self, key: tuple, compute: Callable[[], Awaitable[_T]]) -> _T:
+        key = (self._version, *key)
+        cached = self._entries.get(key)
+        if cached is not None:
+            return cached
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        # Concurrent misses for the same key wait for the first one instead of re-querying.
+        async with lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                cached = await compute()
+                self._entries[key] = cached
+            return cached
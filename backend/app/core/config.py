@@ -1,12 +1,15 @@
-import json
 import os
-from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Union
 
 from pydantic import AnyUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:  # orjson is a faster drop-in for the one JSON parse settings do.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _json_loads
+
 
 def _resolve_version() -> str:
     """Version from APP_VERSION env, else the repo-root VERSION file, else dev."""
@@ -71,6 +74,9 @@ class Settings(BaseSettings):
     net_username: Optional[str] = None
     net_password: Optional[str] = None
     net_enable: Optional[str] = None
+    # Make un-eager-loaded relationship access on hot read paths raise instead of
+    # silently lazy-loading (N+1). Off by default; the test suite turns it on.
+    strict_orm_loading: bool = False
     model_config = SettingsConfigDict(
         env_file=(".env", "backend/.env"),
         env_file_encoding="utf-8",
@@ -87,15 +93,20 @@ class Settings(BaseSettings):
         value = value.strip()
         if not value:
             return []
-        try:
-            parsed = json.loads(value)
-            if isinstance(parsed, list):
-                return [str(origin) for origin in parsed]
-        except json.JSONDecodeError:
-            pass
+        if value.startswith("["):
+            try:
+                parsed = _json_loads(value)
+                if isinstance(parsed, list):
+                    return [str(origin) for origin in parsed]
+            except ValueError:
+                pass
         return [origin.strip() for origin in value.split(",") if origin.strip()]
 
 
-@lru_cache
+# Built once at import; hot paths can read SETTINGS directly, while
+# get_settings() stays the FastAPI dependency / override hook.
+SETTINGS: Settings = Settings()
+
+
 def get_settings() -> Settings:
-    return Settings()
+    return SETTINGS
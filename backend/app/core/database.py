@@ -2,22 +2,91 @@ from typing import AsyncGenerator
 
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase, raiseload
 
 from .config import get_settings
 
+try:  # orjson (de)serializes the JSON columns several times faster than stdlib json.
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-def build_engine(database_url: str, *, echo: bool = False) -> AsyncEngine:
+POOL_SIZE = 20
+POOL_MAX_OVERFLOW = 40
+POOL_TIMEOUT_SECONDS = 30
+POOL_RECYCLE_SECONDS = 1800
+# For networked servers, recycling well inside typical firewall/NAT idle timeouts
+# keeps the main pool free of dead connections without a pre-ping round trip on
+# every checkout. Local SQLite files keep the longer recycle and their warm caches.
+NETWORK_POOL_RECYCLE_SECONDS = 300
+# Login and registration get a small pool of their own with pre-ping enabled
+# (networked backends only).
+AUTH_POOL_SIZE = 4
+AUTH_POOL_MAX_OVERFLOW = 4
+SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+# Per connection; kept modest because the pool may hold up to 60 connections.
+SQLITE_CACHE_SIZE_KIB = 16 * 1024
+# Compiled-SQL LRU shared by all connections. Seven pollers plus the routers can
+# cycle through more distinct statements than the default 500 slots, and anything
+# evicted is recompiled on the next poll.
+QUERY_CACHE_SIZE = 1500
+# asyncpg prepared statements kept per connection (SQLAlchemy adapter and asyncpg's
+# own cache). The defaults of 100 are smaller than the set of statements a pooled
+# connection sees, so hot aggregations were re-parsed and re-planned on each call.
+ASYNCPG_STATEMENT_CACHE_SIZE = 512
+
+
+def _orjson_dumps(value: object) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def build_engine(
+    database_url: str,
+    *,
+    echo: bool = False,
+    pool_size: int = POOL_SIZE,
+    max_overflow: int = POOL_MAX_OVERFLOW,
+    pre_ping: bool = False,
+) -> AsyncEngine:
     """Create an async engine with SQLite-safe defaults when needed."""
 
     connect_args = {}
     is_sqlite = database_url.startswith("sqlite")
 
     if is_sqlite:
-        # Allow longer waits while other connections finish writes.
+        # Allow longer waits while other connections finish writes. sqlite3 applies
+        # this as the connection's busy timeout, so no separate PRAGMA is needed.
         connect_args["timeout"] = 30
+    elif database_url.startswith("postgresql+asyncpg"):
+        connect_args["prepared_statement_cache_size"] = ASYNCPG_STATEMENT_CACHE_SIZE
+        connect_args["statement_cache_size"] = ASYNCPG_STATEMENT_CACHE_SIZE
+
+    pool_args: dict = {}
+    if ":memory:" not in database_url:
+        # Concurrent requests plus background pollers outgrow the default pool of 5;
+        # WAL lets SQLite serve many readers alongside the single writer.
+        pool_args = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": POOL_TIMEOUT_SECONDS,
+            "pool_recycle": POOL_RECYCLE_SECONDS if is_sqlite else NETWORK_POOL_RECYCLE_SECONDS,
+            # Liveness checks only pay off for networked servers, not local files.
+            "pool_pre_ping": pre_ping and not is_sqlite,
+        }
 
-    engine = create_async_engine(database_url, future=True, echo=echo, connect_args=connect_args)
+    json_args: dict = {}
+    if orjson is not None:
+        json_args = {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads}
+
+    engine = create_async_engine(
+        database_url,
+        future=True,
+        echo=echo,
+        connect_args=connect_args,
+        query_cache_size=QUERY_CACHE_SIZE,
+        **pool_args,
+        **json_args,
+    )
 
     if is_sqlite:
 
@@ -27,19 +96,67 @@ def build_engine(database_url: str, *, echo: bool = False) -> AsyncEngine:
             try:
                 cursor.execute("PRAGMA journal_mode=WAL")
                 cursor.execute("PRAGMA synchronous=NORMAL")
-                cursor.execute("PRAGMA busy_timeout=30000")
+                # Pooled connections are long-lived, so give each a warm page cache,
+                # in-memory temp tables and memory-mapped reads of the DB file.
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE_BYTES}")
+                cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KIB}")
             finally:
                 cursor.close()
 
     return engine
 
 
+def build_auth_engine(database_url: str, main_engine: AsyncEngine) -> AsyncEngine:
+    """Engine for login and registration; SQLite shares ``main_engine``."""
+
+    # Pre-ping is a no-op for SQLite, and a second pool on a ``:memory:`` URL would
+    # open a different, empty database.
+    if database_url.startswith("sqlite"):
+        return main_engine
+    return build_engine(
+        database_url,
+        pool_size=AUTH_POOL_SIZE,
+        max_overflow=AUTH_POOL_MAX_OVERFLOW,
+        pre_ping=True,
+    )
+
+
 settings = get_settings()
 engine = build_engine(settings.database_url)
 AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
-Base = declarative_base()
+# A dead connection on the login path would stall the user at the sign-in form, so
+# auth pays for pre-ping on its own pool instead of every request paying for it.
+auth_engine = build_auth_engine(settings.database_url, engine)
+AuthSessionLocal = async_sessionmaker(bind=auth_engine, expire_on_commit=False)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+def strict_loading() -> list:
+    """Loader options that forbid lazy relationship loads when strict ORM loading is on."""
+
+    return [raiseload("*")] if settings.strict_orm_loading else []
+
+
+async def optimize_sqlite(target: AsyncEngine) -> None:
+    """Refresh SQLite query-planner statistics (no-op for other backends)."""
+
+    if target.dialect.name != "sqlite":
+        return
+    async with target.begin() as conn:
+        # analysis_limit bounds ANALYZE work per index so shutdown stays fast.
+        await conn.exec_driver_sql("PRAGMA analysis_limit=400")
+        await conn.exec_driver_sql("PRAGMA optimize")
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_auth_session() -> AsyncGenerator[AsyncSession, None]:
+    async with AuthSessionLocal() as session:
+        yield session
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from pathlib import Path
 
 from alembic import command
 from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 
+from app.core import database
 from app.core.config import get_settings
 
 ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
 MIGRATIONS_PATH = Path(__file__).resolve().parents[2] / "migrations"
 
+logger = logging.getLogger(__name__)
+
 
 def _build_config() -> Config:
     config = Config(str(ALEMBIC_INI_PATH))
@@ -19,8 +25,24 @@ def _build_config() -> Config:
     return config
 
 
+async def _is_at_head(config: Config) -> bool:
+    """Return True when the database's recorded revisions already match the script heads."""
+
+    heads = set(ScriptDirectory.from_config(config).get_heads())
+    async with database.engine.connect() as conn:
+        current = await conn.run_sync(
+            lambda sync_conn: set(MigrationContext.configure(sync_conn).get_current_heads())
+        )
+    return current == heads
+
+
 async def run_migrations() -> None:
     """Apply database migrations up to the latest revision."""
 
     config = _build_config()
+    # An up-to-date schema is the common case on restart; one alembic_version read
+    # avoids spinning up the migration environment and its engine on every boot.
+    if await _is_at_head(config):
+        logger.info("Database schema already at head; skipping migrations")
+        return
     await asyncio.to_thread(command.upgrade, config, "head")
@@ -1,27 +1,35 @@
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any, Dict, Optional
 
-from jose import jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
 
 from .config import get_settings
 
-# Enforce bcrypt's 72-byte limit explicitly to avoid backend detection bugs on newer bcrypt builds.
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__truncate_error=True)
+# bcrypt only reads the first 72 bytes of a password; reject longer ones instead of silently truncating.
+BCRYPT_MAX_PASSWORD_BYTES = 72
 settings = get_settings()
 
 
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     if expires_delta is None:
-        expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
-    expire = datetime.utcnow() + expires_delta
-    to_encode: Dict[str, Any] = {"exp": expire, "sub": str(subject)}
+        lifetime_seconds = settings.access_token_expire_minutes * 60
+    else:
+        lifetime_seconds = expires_delta.total_seconds()
+    to_encode: Dict[str, Any] = {"exp": int(time.time() + lifetime_seconds), "sub": str(subject)}
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    secret = plain_password.encode("utf-8")
+    if len(secret) > BCRYPT_MAX_PASSWORD_BYTES:
+        return False
+    return bcrypt.checkpw(secret, hashed_password.encode("utf-8"))
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    secret = password.encode("utf-8")
+    if len(secret) > BCRYPT_MAX_PASSWORD_BYTES:
+        raise ValueError(f"Password exceeds bcrypt's {BCRYPT_MAX_PASSWORD_BYTES}-byte limit")
+    return bcrypt.hashpw(secret, bcrypt.gensalt()).decode("ascii")
@@ -1,8 +1,45 @@
+import os
+import threading
 import uuid
+from typing import Iterator
 
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.types import CHAR, TypeDecorator
 
+# Primary-key defaults draw random bytes from one os.urandom() call per 256 ids
+# instead of one syscall per row; bulk poller inserts create thousands of rows.
+_UUID_BATCH_BYTES = 4096
+_UUID_V4_CLEAR = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID_V4_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+
+def _uuid4_stream() -> Iterator[uuid.UUID]:
+    while True:
+        pool = os.urandom(_UUID_BATCH_BYTES)
+        for offset in range(0, _UUID_BATCH_BYTES, 16):
+            value = int.from_bytes(pool[offset : offset + 16], "big")
+            yield uuid.UUID(int=(value & _UUID_V4_CLEAR) | _UUID_V4_BITS)
+
+
+_uuid_lock = threading.Lock()
+_uuid_stream = _uuid4_stream()
+
+
+def _reset_uuid_stream() -> None:
+    # A forked child must not replay the parent's buffered randomness.
+    global _uuid_lock, _uuid_stream
+    _uuid_lock = threading.Lock()
+    _uuid_stream = _uuid4_stream()
+
+
+os.register_at_fork(after_in_child=_reset_uuid_stream)
+
+
+def new_uuid() -> uuid.UUID:
+    """Random (version 4) UUID for column defaults; drop-in for ``uuid.uuid4``."""
+    with _uuid_lock:
+        return next(_uuid_stream)
+
 
 class GUID(TypeDecorator):
     """Platform-independent GUID column."""
@@ -20,6 +57,9 @@ class GUID(TypeDecorator):
             return value
         if dialect.name == "postgresql":
             return str(value)
+        if isinstance(value, str) and len(value) == 36 and value.islower():
+            # Already in the canonical CHAR(36) form; skip the UUID round-trip.
+            return value
         if not isinstance(value, uuid.UUID):
             return str(uuid.UUID(value))
         return str(value)
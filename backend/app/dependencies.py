@@ -1,26 +1,65 @@
-from typing import AsyncGenerator
-from uuid import UUID
+import hashlib
+import time
+from typing import AsyncGenerator, Optional, Tuple
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.config import get_settings
-from app.core.database import get_session
+from app.core.database import get_auth_session, get_session
 from app.models import User, UserRoleEnum
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 settings = get_settings()
 
+# Token digest -> (subject, exp). Skips re-verifying the same token's HMAC
+# signature on every request; the user row is still loaded per request so
+# deactivation/role changes apply immediately. Keyed by a short digest so the
+# cache holds neither raw tokens nor their full length.
+_TOKEN_CACHE: "TTLCache[bytes, Tuple[str, float]]" = TTLCache(maxsize=4096, ttl=30)
+
+
+def decode_token_subject(token: str) -> Optional[str]:
+    """Return the ``sub`` of a valid access token; raises ``jwt.PyJWTError`` if invalid.
+
+    Only successful decodes are cached, so a rejected token is re-verified each time.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        subject, expires_at = cached
+        if expires_at > time.time():
+            return subject
+        _TOKEN_CACHE.pop(key, None)
+        return None
+
+    # PyJWT rejects a missing sub/exp (and validates exp) as part of the decode itself.
+    payload = jwt.decode(
+        token,
+        settings.secret_key,
+        algorithms=[settings.jwt_algorithm],
+        options={"require": ["sub", "exp"]},
+    )
+    subject = payload["sub"]
+    _TOKEN_CACHE[key] = (subject, float(payload["exp"]))
+    return subject
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async for session in get_session():
         yield session
 
 
+async def get_auth_db() -> AsyncGenerator[AsyncSession, None]:
+    async for session in get_auth_session():
+        yield session
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
@@ -31,14 +70,13 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        user_id: str = payload.get("sub")
+        user_id = decode_token_subject(token)
         if user_id is None:
             raise credentials_exception
-    except JWTError as exc:  # noqa: F841
+    except jwt.PyJWTError as exc:  # noqa: F841
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
+    result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
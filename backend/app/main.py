@@ -6,8 +6,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.api_v1 import api_router
 from app.core.config import get_settings
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncSessionLocal, engine, optimize_sqlite
 from app.core.migrator import run_migrations
+from app.routers.inventory import NEXT_CURSOR_HEADER
 from app.services.inventory_poller import build_inventory_poller
 from app.services.ipmpls_poller import build_ipmpls_poller
 from app.services.nxos_poller import build_nxos_poller
@@ -15,6 +16,7 @@ from app.services.cgnat_poller import build_cgnat_poller
 from app.services.cpnr_poller import build_cpnr_poller
 from app.services.pbr_collector import build_pbr_poller
 from app.services.telco_collector import build_telco_poller
+from app.services.vsphere import shutdown_collect_pool
 
 settings = get_settings()
 
@@ -113,15 +115,23 @@ async def lifespan(app: FastAPI):  # noqa: ANN001 - FastAPI signature contract
             await telco_poller.stop()
         if inventory_poller:
             await inventory_poller.stop()
+        shutdown_collect_pool()
+        try:
+            await optimize_sqlite(engine)
+        except Exception:  # pragma: no cover - best effort on shutdown
+            logger.warning("PRAGMA optimize failed during shutdown", exc_info=True)
 
 
 app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
+# Starlette's CORSMiddleware is pure ASGI and precomputes its headers; a frozenset
+# makes the per-request origin check a hash lookup instead of a list scan.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=frozenset(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
@@ -29,6 +29,8 @@ from .inventory import (
     InventoryPowerState,
     InventoryDatastore,
     InventoryNetwork,
+    InventorySyncJob,
+    InventorySyncJobStatus,
     InventoryVirtualMachine,
 )
 from .aci import (
@@ -88,6 +90,8 @@ __all__ = [
     "InventoryPowerState",
     "InventoryDatastore",
     "InventoryNetwork",
+    "InventorySyncJob",
+    "InventorySyncJobStatus",
     "InventoryVirtualMachine",
     "AciFabricEndpoint",
     "AciFabricNode",
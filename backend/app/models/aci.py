@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-import uuid
+import re
 from datetime import datetime
 from enum import Enum as PyEnum
+from functools import lru_cache
 from typing import Any, Dict
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, JSON, String, Text, ForeignKey, UniqueConstraint, func
+from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, JSON, String, Text, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
+
+# First DN path segment that starts with "pod-".
+_POD_RE = re.compile(r"(?:^|/)(pod-[^/]*)")
+# APIC delayedHeartbeat values that mean "yes".
+_TRUTHY = frozenset({"yes", "true", "1"})
 
 
 class AciNodeRole(str, PyEnum):
@@ -22,23 +28,30 @@ class AciNodeRole(str, PyEnum):
     def from_raw(cls, raw: str | None) -> "AciNodeRole":
         if not raw:
             return cls.UNSPECIFIED
-        value = raw.strip().lower()
-        if value in {"leaf", "tier-2-leaf"}:
-            return cls.LEAF
-        if value == "spine":
-            return cls.SPINE
-        if value in {"controller", "apic"}:
-            return cls.CONTROLLER
-        return cls.UNSPECIFIED
+        return _ROLE_ALIASES.get(raw.strip().lower(), cls.UNSPECIFIED)
+
+
+# Raw APIC role strings (lower-cased) -> AciNodeRole.
+_ROLE_ALIASES: Dict[str, AciNodeRole] = {
+    "leaf": AciNodeRole.LEAF,
+    "tier-2-leaf": AciNodeRole.LEAF,
+    "spine": AciNodeRole.SPINE,
+    "controller": AciNodeRole.CONTROLLER,
+    "apic": AciNodeRole.CONTROLLER,
+}
 
 
 class AciFabricNode(Base):
     __tablename__ = "aci_fabric_nodes"
-    __table_args__ = (UniqueConstraint("fabric_job_id", "distinguished_name", name="uq_aci_fabric_node_job_dn"),)
+    __table_args__ = (
+        UniqueConstraint("fabric_job_id", "distinguished_name", name="uq_aci_fabric_node_job_dn"),
+        # Covers the DISTINCT filter-choice lookup in the fabric summary details.
+        Index("ix_aci_node_role_model_version_state", "role", "model", "version", "fabric_state"),
+    )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     distinguished_name = Column(String, nullable=False)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, index=True)
     role = Column(Enum(AciNodeRole), nullable=False, default=AciNodeRole.UNSPECIFIED)
     node_id = Column(String, nullable=False)
     address = Column(String, nullable=True)
@@ -62,45 +75,47 @@ class AciFabricNode(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    fabric_job = relationship("TelcoFabricOnboardingJob", back_populates="nodes", lazy="selectin")
+    # Node lists are large and the poller never reads the job; callers that need
+    # fabric_name/fabric_ip must load it explicitly (selectinload).
+    fabric_job = relationship("TelcoFabricOnboardingJob", back_populates="nodes", lazy="raise")
     detail = relationship("AciFabricNodeDetail", back_populates="node", uselist=False, cascade="all, delete-orphan")
     interfaces = relationship("AciFabricNodeInterface", back_populates="node", cascade="all, delete-orphan")
 
     def update_from_attributes(self, attributes: Dict[str, Any]) -> None:
-        self.name = attributes.get("name", self.name)
-        self.node_id = attributes.get("id", self.node_id)
-        self.address = attributes.get("address")
-        self.serial = attributes.get("serial")
-        self.model = attributes.get("model")
-        self.version = attributes.get("version")
-        self.vendor = attributes.get("vendor")
-        self.node_type = attributes.get("nodeType")
-        self.apic_type = attributes.get("apicType")
-        self.fabric_state = attributes.get("fabricSt")
-        self.admin_state = attributes.get("adSt")
-        delayed = attributes.get("delayedHeartbeat")
+        get = attributes.get  # bound once; this runs for every node on every poll
+        self.name = get("name", self.name)
+        self.node_id = get("id", self.node_id)
+        self.address = get("address")
+        self.serial = get("serial")
+        self.model = get("model")
+        self.version = get("version")
+        self.vendor = get("vendor")
+        self.node_type = get("nodeType")
+        self.apic_type = get("apicType")
+        self.fabric_state = get("fabricSt")
+        self.admin_state = get("adSt")
+        delayed = get("delayedHeartbeat")
         if delayed is not None:
-            self.delayed_heartbeat = str(delayed).strip().lower() in {"yes", "true", "1"}
-        role_value = attributes.get("role")
+            self.delayed_heartbeat = str(delayed).strip().lower() in _TRUTHY
+        role_value = get("role")
         if role_value:
             self.role = AciNodeRole.from_raw(role_value)
-        dn_value = attributes.get("dn")
+        dn_value = get("dn")
         if dn_value:
             self.distinguished_name = dn_value
-            if "pod-" in dn_value:
-                # Example DN: topology/pod-1/node-120
-                parts = dn_value.split("/")
-                for part in parts:
-                    if part.startswith("pod-"):
-                        self.pod = part
-                        break
-        last_state_ts = attributes.get("lastStateModTs")
+            # Example DN: topology/pod-1/node-120
+            pod_match = _POD_RE.search(dn_value)
+            if pod_match:
+                self.pod = pod_match.group(1)
+        last_state_ts = get("lastStateModTs")
         if isinstance(last_state_ts, str) and last_state_ts:
             self.last_state_change_at = _parse_timestamp(last_state_ts)
-        mod_ts = attributes.get("modTs")
+        mod_ts = get("modTs")
         if isinstance(mod_ts, str) and mod_ts:
             self.last_modified_at = _parse_timestamp(mod_ts)
-        self.raw_attributes = attributes
+        # Reassigning an equal payload would still mark the JSON column dirty.
+        if self.raw_attributes != attributes:
+            self.raw_attributes = attributes
 
     @property
     def fabric_name(self) -> str | None:
@@ -115,9 +130,12 @@ class AciFabricNode(Base):
         return self.fabric_job.target_host
 
 
+# APIC modTs/lastStateModTs rarely change between polls; datetimes are immutable, so sharing is safe.
+@lru_cache(maxsize=4096)
 def _parse_timestamp(value: str) -> datetime | None:
     try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        # Python 3.11+ accepts a trailing "Z" natively.
+        return datetime.fromisoformat(value)
     except ValueError:
         return None
 
@@ -125,7 +143,7 @@ def _parse_timestamp(value: str) -> datetime | None:
 class AciFabricNodeDetail(Base):
     __tablename__ = "aci_fabric_node_details"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     node_id = Column(GUID(), ForeignKey("aci_fabric_nodes.id", ondelete="CASCADE"), nullable=False, unique=True)
     fabric_job_id = Column(GUID(), ForeignKey("telco_fabric_onboarding_jobs.id"), nullable=True)
     general = Column(JSON, nullable=False, default=dict)
@@ -146,7 +164,7 @@ class AciFabricNodeInterface(Base):
     __tablename__ = "aci_fabric_node_interfaces"
     __table_args__ = (UniqueConstraint("node_id", "name", name="uq_aci_node_interface"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     node_id = Column(GUID(), ForeignKey("aci_fabric_nodes.id", ondelete="CASCADE"), nullable=False, index=True)
     fabric_job_id = Column(GUID(), ForeignKey("telco_fabric_onboarding_jobs.id"), nullable=True)
     name = Column(String, nullable=False)
@@ -184,7 +202,7 @@ class AciFabricEndpoint(Base):
         UniqueConstraint("fabric_job_id", "distinguished_name", name="uq_aci_fabric_endpoint"),
     )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     fabric_job_id = Column(
         GUID(), ForeignKey("telco_fabric_onboarding_jobs.id", ondelete="CASCADE"), nullable=True, index=True
     )
@@ -230,7 +248,7 @@ class AciFabricVlan(Base):
         UniqueConstraint("fabric_job_id", "encap", name="uq_aci_fabric_vlan"),
     )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     fabric_job_id = Column(
         GUID(), ForeignKey("telco_fabric_onboarding_jobs.id", ondelete="CASCADE"), nullable=True, index=True
     )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
@@ -21,7 +20,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class CgnatVendor(str, PyEnum):
@@ -49,7 +48,7 @@ class CgnatDevice(Base):
     __tablename__ = "cgnat_devices"
     __table_args__ = (UniqueConstraint("mgmt_ip", name="uq_cgnat_device_mgmt_ip"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     name = Column(String, nullable=False)
     hostname = Column(String, nullable=True)
     mgmt_ip = Column(String, nullable=False)
@@ -100,7 +99,7 @@ class CgnatInterface(Base):
     # partition included: A10 L3V partitions can reuse the same ve number.
     __table_args__ = (UniqueConstraint("device_id", "name", "partition", name="uq_cgnat_interface"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("cgnat_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
@@ -127,7 +126,7 @@ class CgnatNatPool(Base):
     __tablename__ = "cgnat_nat_pools"
     __table_args__ = (UniqueConstraint("device_id", "pool_name", "partition", name="uq_cgnat_pool"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("cgnat_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     pool_name = Column(String, nullable=False)
     kind = Column(String, nullable=True)  # nat | lsn
@@ -157,7 +156,7 @@ class CgnatStaticRoute(Base):
 
     __tablename__ = "cgnat_static_routes"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("cgnat_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=True)
     destination = Column(String, nullable=True)  # dest + prefix (may carry %route-domain on F5)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
@@ -19,7 +18,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class CpnrRole(str, PyEnum):
@@ -56,7 +55,7 @@ class CpnrVm(Base):
     __tablename__ = "cpnr_vms"
     __table_args__ = (UniqueConstraint("mgmt_ip", name="uq_cpnr_vm_mgmt_ip"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     name = Column(String, nullable=False)
     site = Column(String, nullable=True)          # Bangalore / Mumbai / ...
     service = Column(String, nullable=True)        # Utility / FTTx / WIFI / A6 / ...
@@ -104,7 +103,7 @@ class CpnrObject(Base):
         UniqueConstraint("vm_id", "object_type", "object_key", name="uq_cpnr_object"),
     )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     vm_id = Column(GUID(), ForeignKey("cpnr_vms.id", ondelete="CASCADE"), nullable=False, index=True)
     object_type = Column(String, nullable=False, index=True)  # one of CPNR_OBJECT_TYPES
     object_key = Column(String, nullable=False)               # business key (name/ipaddr/ip6Address)
@@ -121,7 +120,7 @@ class CpnrChangeEvent(Base):
 
     __tablename__ = "cpnr_change_events"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     vm_id = Column(GUID(), ForeignKey("cpnr_vms.id", ondelete="CASCADE"), nullable=False, index=True)
     ts = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     object_type = Column(String, nullable=False)
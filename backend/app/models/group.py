@@ -1,16 +1,14 @@
-import uuid
-
 from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class Group(Base):
     __tablename__ = "groups"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     name = Column(String, unique=True, nullable=False)
     description = Column(String, nullable=True)
 
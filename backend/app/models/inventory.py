@@ -1,11 +1,12 @@
-import uuid
+from datetime import datetime, timezone
 from enum import Enum as PyEnum
+from typing import Any, Dict
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Integer, JSON, LargeBinary, String, Text, UniqueConstraint, func
+from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, JSON, LargeBinary, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class InventoryEndpointType(str, PyEnum):
@@ -21,8 +22,11 @@ class InventoryEndpointStatus(str, PyEnum):
 
 class InventoryEndpoint(Base):
     __tablename__ = "inventory_endpoints"
+    # Fetch server-generated timestamps with INSERT/UPDATE ... RETURNING so handlers
+    # need no refresh() round trip before serializing.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     address = Column(String, nullable=False)
@@ -51,6 +55,13 @@ class InventoryEndpoint(Base):
     networks = relationship(
         "InventoryNetwork", back_populates="endpoint", cascade="all, delete-orphan"
     )
+    sync_jobs = relationship(
+        "InventorySyncJob", back_populates="endpoint", cascade="all, delete-orphan"
+    )
+
+    @property
+    def has_credentials(self) -> bool:
+        return bool(self.password_secret)
 
 
 class InventoryHostConnectionState(str, PyEnum):
@@ -70,7 +81,7 @@ class InventoryHost(Base):
     __tablename__ = "inventory_hosts"
     __table_args__ = (UniqueConstraint("endpoint_id", "name", name="uq_inventory_host_endpoint_name"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     endpoint_id = Column(GUID(), ForeignKey("inventory_endpoints.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     serial = Column(String, nullable=True)
@@ -103,6 +114,10 @@ class InventoryHost(Base):
     nics = relationship("InventoryHostNic", back_populates="host", cascade="all, delete-orphan")
     portgroups = relationship("InventoryHostPortgroup", back_populates="host", cascade="all, delete-orphan")
 
+    @property
+    def endpoint_name(self) -> str:
+        return self.endpoint.name if self.endpoint is not None else "Unknown"
+
 
 class InventoryHostPortgroup(Base):
     """Portgroup on an ESXi host mapped to its vSwitch/vDS uplink pnics (VM connectivity path)."""
@@ -110,7 +125,7 @@ class InventoryHostPortgroup(Base):
     __tablename__ = "inventory_host_portgroups"
     __table_args__ = (UniqueConstraint("host_id", "name", name="uq_inventory_host_portgroup"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     host_id = Column(GUID(), ForeignKey("inventory_hosts.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     switch_name = Column(String, nullable=True)
@@ -129,7 +144,7 @@ class InventoryHostNic(Base):
 
     __tablename__ = "inventory_host_nics"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     host_id = Column(GUID(), ForeignKey("inventory_hosts.id", ondelete="CASCADE"), nullable=False, index=True)
     device = Column(String, nullable=False)  # vmnicN
     mac = Column(String, nullable=True)
@@ -148,9 +163,13 @@ class InventoryHostNic(Base):
 
 class InventoryVirtualMachine(Base):
     __tablename__ = "inventory_virtual_machines"
-    __table_args__ = (UniqueConstraint("endpoint_id", "name", name="uq_inventory_vm_endpoint_name"),)
+    __table_args__ = (
+        UniqueConstraint("endpoint_id", "name", name="uq_inventory_vm_endpoint_name"),
+        # Serves the host-filtered VM list in name order (endpoint_id, name is unique above).
+        Index("ix_inventory_vm_host_name", "host_id", "name"),
+    )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     endpoint_id = Column(GUID(), ForeignKey("inventory_endpoints.id", ondelete="CASCADE"), nullable=False, index=True)
     host_id = Column(GUID(), ForeignKey("inventory_hosts.id", ondelete="SET NULL"), nullable=True, index=True)
     name = Column(String, nullable=False)
@@ -174,12 +193,20 @@ class InventoryVirtualMachine(Base):
     endpoint = relationship("InventoryEndpoint", back_populates="virtual_machines")
     host = relationship("InventoryHost", back_populates="virtual_machines")
 
+    @property
+    def endpoint_name(self) -> str:
+        return self.endpoint.name if self.endpoint is not None else "Unknown"
+
+    @property
+    def host_name(self) -> str | None:
+        return self.host.name if self.host is not None else None
+
 
 class InventoryDatastore(Base):
     __tablename__ = "inventory_datastores"
     __table_args__ = (UniqueConstraint("endpoint_id", "name", name="uq_inventory_datastore_endpoint_name"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     endpoint_id = Column(GUID(), ForeignKey("inventory_endpoints.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     type = Column(String, nullable=True)
@@ -191,12 +218,16 @@ class InventoryDatastore(Base):
 
     endpoint = relationship("InventoryEndpoint", back_populates="datastores")
 
+    @property
+    def endpoint_name(self) -> str:
+        return self.endpoint.name if self.endpoint is not None else "Unknown"
+
 
 class InventoryNetwork(Base):
     __tablename__ = "inventory_networks"
     __table_args__ = (UniqueConstraint("endpoint_id", "name", name="uq_inventory_network_endpoint_name"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     endpoint_id = Column(GUID(), ForeignKey("inventory_endpoints.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     last_seen_at = Column(DateTime(timezone=True), nullable=True)
@@ -204,3 +235,47 @@ class InventoryNetwork(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     endpoint = relationship("InventoryEndpoint", back_populates="networks")
+
+    @property
+    def endpoint_name(self) -> str:
+        return self.endpoint.name if self.endpoint is not None else "Unknown"
+
+
+class InventorySyncJobStatus(str, PyEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    ERROR = "error"
+
+
+class InventorySyncJob(Base):
+    """An on-demand endpoint poll, run after the triggering request has returned."""
+
+    __tablename__ = "inventory_sync_jobs"
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(GUID(), primary_key=True, default=new_uuid)
+    endpoint_id = Column(GUID(), ForeignKey("inventory_endpoints.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(Enum(InventorySyncJobStatus), nullable=False, default=InventorySyncJobStatus.PENDING)
+    summary = Column(JSON, nullable=True)
+    error_message = Column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    endpoint = relationship("InventoryEndpoint", back_populates="sync_jobs")
+
+    def mark_running(self) -> None:
+        self.status = InventorySyncJobStatus.RUNNING
+        self.started_at = datetime.now(timezone.utc)
+
+    def mark_done(self, summary: Dict[str, Any]) -> None:
+        self.status = InventorySyncJobStatus.DONE
+        self.summary = summary
+        self.error_message = None
+        self.finished_at = datetime.now(timezone.utc)
+
+    def mark_failed(self, message: str) -> None:
+        self.status = InventorySyncJobStatus.ERROR
+        self.error_message = message
+        self.finished_at = datetime.now(timezone.utc)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
@@ -20,7 +19,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class IpMplsPlatform(str, PyEnum):
@@ -52,7 +51,7 @@ class IpMplsDevice(Base):
     __tablename__ = "ip_mpls_devices"
     __table_args__ = (UniqueConstraint("mgmt_ip", name="uq_ipmpls_device_mgmt_ip"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     name = Column(String, nullable=False)
     hostname = Column(String, nullable=True)
     mgmt_ip = Column(String, nullable=False)
@@ -90,7 +89,7 @@ class IpMplsInterface(Base):
     __tablename__ = "ip_mpls_interfaces"
     __table_args__ = (UniqueConstraint("device_id", "name", name="uq_ipmpls_interface"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("ip_mpls_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
@@ -113,7 +112,7 @@ class IpMplsInterface(Base):
 class IpMplsModule(Base):
     __tablename__ = "ip_mpls_modules"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("ip_mpls_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=True)
     description = Column(String, nullable=True)
@@ -130,7 +129,7 @@ class IpMplsVrf(Base):
     __tablename__ = "ip_mpls_vrfs"
     __table_args__ = (UniqueConstraint("device_id", "name", name="uq_ipmpls_vrf"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("ip_mpls_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     rd = Column(String, nullable=True)
@@ -148,7 +147,7 @@ class IpMplsVrf(Base):
 class IpMplsNeighbor(Base):
     __tablename__ = "ip_mpls_neighbors"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("ip_mpls_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     protocol = Column(String, nullable=False)  # isis | ldp | bgp | ospf
     neighbor_id = Column(String, nullable=True)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
@@ -19,7 +18,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class NxosPlatform(str, PyEnum):
@@ -48,7 +47,7 @@ class NxosDevice(Base):
     __tablename__ = "nxos_devices"
     __table_args__ = (UniqueConstraint("mgmt_ip", name="uq_nxos_device_mgmt_ip"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     name = Column(String, nullable=False)
     hostname = Column(String, nullable=True)
     mgmt_ip = Column(String, nullable=False)
@@ -87,7 +86,7 @@ class NxosInterface(Base):
     __tablename__ = "nxos_interfaces"
     __table_args__ = (UniqueConstraint("device_id", "name", name="uq_nxos_interface"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("nxos_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
@@ -113,7 +112,7 @@ class NxosInterface(Base):
 class NxosModule(Base):
     __tablename__ = "nxos_modules"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("nxos_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=True)
     description = Column(String, nullable=True)
@@ -131,7 +130,7 @@ class NxosVrf(Base):
     __tablename__ = "nxos_vrfs"
     __table_args__ = (UniqueConstraint("device_id", "name", name="uq_nxos_vrf"),)
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("nxos_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     rd = Column(String, nullable=True)
@@ -155,7 +154,7 @@ class NxosNeighbor(Base):
         ),
     )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("nxos_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     protocol = Column(String, nullable=False)  # cdp | lldp
     local_interface = Column(String, nullable=True)
@@ -175,7 +174,7 @@ class NxosBgpNeighbor(Base):
 
     __tablename__ = "nxos_bgp_neighbors"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     device_id = Column(GUID(), ForeignKey("nxos_devices.id", ondelete="CASCADE"), nullable=False, index=True)
     vrf = Column(String, nullable=True)
     address_family = Column(String, nullable=True)
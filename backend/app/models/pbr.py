@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
@@ -19,7 +18,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class PbrLayer(str, PyEnum):
@@ -93,7 +92,7 @@ class PbrService(Base):
         UniqueConstraint("fabric_job_id", "contract_dn", "graph_dn", name="uq_pbr_service_job_contract_graph"),
     )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     fabric_job_id = Column(
         GUID(), ForeignKey("telco_fabric_onboarding_jobs.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -136,7 +135,7 @@ class PbrNode(Base):
         UniqueConstraint("service_id", "distinguished_name", name="uq_pbr_node_service_dn"),
     )
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     fabric_job_id = Column(
         GUID(), ForeignKey("telco_fabric_onboarding_jobs.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -195,7 +194,7 @@ class PbrRedirectDest(Base):
 
     __tablename__ = "pbr_redirect_dests"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     node_id = Column(GUID(), ForeignKey("pbr_nodes.id", ondelete="CASCADE"), nullable=False, index=True)
 
     ip = Column(String, nullable=True)
@@ -218,7 +217,7 @@ class PbrSubnet(Base):
 
     __tablename__ = "pbr_subnets"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     fabric_job_id = Column(
         GUID(), ForeignKey("telco_fabric_onboarding_jobs.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -244,7 +243,7 @@ class PbrHealthSample(Base):
 
     __tablename__ = "pbr_health_samples"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     service_id = Column(GUID(), ForeignKey("pbr_services.id", ondelete="CASCADE"), nullable=False, index=True)
     sampled_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     health_pct = Column(Float, nullable=True)
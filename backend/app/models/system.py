@@ -1,11 +1,10 @@
-import uuid
 from enum import Enum as PyEnum
 
 from sqlalchemy import Column, Enum, ForeignKey, LargeBinary, String
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class AccessType(str, PyEnum):
@@ -17,7 +16,7 @@ class AccessType(str, PyEnum):
 class System(Base):
     __tablename__ = "systems"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     group_id = Column(GUID(), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
     name = Column(String, nullable=False)
     ip_address = Column(String, nullable=False)
@@ -33,8 +32,8 @@ class System(Base):
 class SystemCredential(Base):
     __tablename__ = "system_credentials"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    system_id = Column(GUID(), ForeignKey("systems.id", ondelete="CASCADE"), nullable=False)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
+    system_id = Column(GUID(), ForeignKey("systems.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column("label", String, nullable=False)
     login_endpoint = Column(String, nullable=False)
     access_scope = Column(Enum(AccessType), nullable=False)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime, timezone
 from enum import Enum as PyEnum
 from typing import Any, Dict
@@ -9,7 +8,7 @@ from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, JSON, LargeBina
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class TelcoFabricType(str, PyEnum):
@@ -26,8 +25,11 @@ class TelcoOnboardingStatus(str, PyEnum):
 
 class TelcoFabricOnboardingJob(Base):
     __tablename__ = "telco_fabric_onboarding_jobs"
+    # Fetch server-generated timestamps with INSERT/UPDATE ... RETURNING so handlers
+    # need no refresh() round trip before serializing.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     name = Column(String, nullable=False)
     fabric_type = Column(Enum(TelcoFabricType), nullable=False)
     target_host = Column(String, nullable=False)
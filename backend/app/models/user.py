@@ -1,11 +1,10 @@
-import uuid
 from enum import Enum as PyEnum
 
 from sqlalchemy import Boolean, Column, Enum, String
 from sqlalchemy.types import LargeBinary
 
 from app.core.database import Base
-from app.core.types import GUID
+from app.core.types import GUID, new_uuid
 
 
 class UserRoleEnum(str, PyEnum):
@@ -16,7 +15,7 @@ class UserRoleEnum(str, PyEnum):
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=new_uuid)
     email = Column(String, unique=True, index=True, nullable=False)
     full_name = Column(String, nullable=False)
     hashed_password = Column(String, nullable=False)
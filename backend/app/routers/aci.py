@@ -5,11 +5,13 @@ from collections import Counter, defaultdict
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import String, func, or_, select
+from sqlalchemy import String, func, lambda_stmt, literal_column, or_, select
 from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import WriteVersionedCache
+from app.core.database import strict_loading
 from app.dependencies import get_current_user, get_db
 from app.models import (
     AciFabricEndpoint,
@@ -39,6 +41,43 @@ from app.schemas import (
 
 router = APIRouter(prefix="/aci", tags=["aci"])
 
+UNASSIGNED_FABRIC_NAME = "Unassigned Fabric"
+# Rows fetched per round trip when streaming interfaces for the free-port report.
+FREE_PORT_STREAM_BATCH = 500
+
+# Dashboards poll the fabric summaries; serve repeats from memory for a few seconds.
+# Any committed write to the nodes or their fabric jobs (names, hosts, poll times
+# appear in the details) invalidates them immediately.
+SUMMARY_CACHE_TTL_SECONDS = 15
+_summary_cache = WriteVersionedCache(AciFabricNode, TelcoFabricOnboardingJob, ttl=SUMMARY_CACHE_TTL_SECONDS)
+
+
+def _unknown_if_blank(column):
+    """SQL for ``column or "unknown"`` so GROUP BY buckets match the Python fallback."""
+    # Inline literals rather than bound parameters: PostgreSQL only matches a GROUP BY
+    # expression to the select list when both are textually identical.
+    return func.coalesce(func.nullif(column, literal_column("''")), literal_column("'unknown'"))
+
+
+def _node_read_columns(telco_alias) -> tuple:
+    """Columns backing AciFabricNodeRead, with the fabric name/IP taken from ``telco_alias``."""
+    columns = [
+        getattr(AciFabricNode, field)
+        for field in AciFabricNodeRead.model_fields
+        if field not in ("fabric_name", "fabric_ip")
+    ]
+    return (*columns, telco_alias.name.label("fabric_name"), telco_alias.target_host.label("fabric_ip"))
+
+
+def _load_fabric_job(relationship):
+    """selectinload the owning job with only the columns ``fabric_name``/``fabric_ip`` read.
+
+    Skips the job's JSON snapshot, connection params and encrypted password, none of
+    which the ACI views use.
+    """
+
+    return selectinload(relationship).load_only(TelcoFabricOnboardingJob.name, TelcoFabricOnboardingJob.target_host)
+
 
 def _serialize_node(node: AciFabricNode) -> AciFabricNodeRead:
     return AciFabricNodeRead.model_validate(node, from_attributes=True)
@@ -76,59 +115,59 @@ async def list_fabric_nodes(
     telco_alias = aliased(TelcoFabricOnboardingJob)
 
     conditions = []
+    # Plain column rows: the list never needs ORM identity/state, and the fabric
+    # name/IP come straight from the join rather than a second selectin query.
+    # The total rides along as a window column, so a page costs one query.
     stmt = (
-        select(AciFabricNode)
-        .options(selectinload(AciFabricNode.fabric_job))
+        select(*_node_read_columns(telco_alias), func.count().over().label("total_count"))
         .outerjoin(telco_alias, AciFabricNode.fabric_job_id == telco_alias.id)
         .order_by(AciFabricNode.name)
     )
-    count_stmt = select(func.count()).select_from(AciFabricNode).outerjoin(
-        telco_alias, AciFabricNode.fabric_job_id == telco_alias.id
-    )
 
     if role is not None:
         condition = AciFabricNode.role == role
         conditions.append(condition)
 
     if search:
-        pattern = f"%{search.strip().lower()}%"
+        # Bare ILIKE (NULL never matches) keeps these byte-identical to the pg_trgm indexes.
+        pattern = f"%{search.strip()}%"
         search_condition = or_(
-            func.lower(AciFabricNode.name).like(pattern),
-            func.lower(AciFabricNode.address).like(pattern),
-            func.lower(AciFabricNode.serial).like(pattern),
-            func.lower(AciFabricNode.model).like(pattern),
-            func.lower(func.coalesce(AciFabricNode.site_name, "")).like(pattern),
-            func.lower(func.coalesce(AciFabricNode.rack_location, "")).like(pattern),
-            func.lower(func.coalesce(AciFabricNode.version, "")).like(pattern),
-            func.lower(func.coalesce(AciFabricNode.fabric_state, "")).like(pattern),
-            func.lower(func.coalesce(AciFabricNode.role, "")).like(pattern),
-            func.lower(func.coalesce(AciFabricNode.pod, "")).like(pattern),
-            func.lower(func.coalesce(AciFabricNode.distinguished_name, "")).like(pattern),
-            func.lower(func.coalesce(telco_alias.name, "")).like(pattern),
-            func.lower(func.coalesce(telco_alias.target_host, "")).like(pattern),
+            AciFabricNode.name.ilike(pattern),
+            AciFabricNode.address.ilike(pattern),
+            AciFabricNode.serial.ilike(pattern),
+            AciFabricNode.model.ilike(pattern),
+            AciFabricNode.site_name.ilike(pattern),
+            AciFabricNode.rack_location.ilike(pattern),
+            AciFabricNode.version.ilike(pattern),
+            AciFabricNode.fabric_state.ilike(pattern),
+            func.cast(AciFabricNode.role, String).ilike(pattern),
+            AciFabricNode.pod.ilike(pattern),
+            AciFabricNode.distinguished_name.ilike(pattern),
+            telco_alias.name.ilike(pattern),
+            telco_alias.target_host.ilike(pattern),
         )
         conditions.append(search_condition)
 
     for condition in conditions:
         stmt = stmt.where(condition)
-        count_stmt = count_stmt.where(condition)
-
-    total = (await db.execute(count_stmt)).scalar_one()
-
-    if total == 0:
-        page = 1
-    else:
-        last_page = max(1, (total + page_size - 1) // page_size)
-        if page > last_page:
-            page = last_page
 
     offset = (page - 1) * page_size
-    stmt = stmt.offset(offset).limit(page_size)
-
-    result = await db.execute(stmt)
-    nodes = result.scalars().all()
-
-    items = [_serialize_node(node) for node in nodes]
+    rows = (await db.execute(stmt.offset(offset).limit(page_size))).mappings().all()
+    if rows:
+        total = rows[0]["total_count"]
+    elif page == 1:
+        total = 0
+    else:
+        # Past the last page there are no rows to carry the total; count, then clamp
+        # to the last page as before.
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        total = (await db.execute(count_stmt)).scalar_one()
+        page = max(1, (total + page_size - 1) // page_size)
+        offset = (page - 1) * page_size
+        if total:
+            rows = (await db.execute(stmt.offset(offset).limit(page_size))).mappings().all()
+
+    items = [AciFabricNodeRead(**row) for row in rows]
     has_next = offset + len(items) < total
     has_prev = page > 1
 
@@ -148,7 +187,7 @@ async def get_fabric_node(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ) -> AciFabricNodeRead:
-    node = await db.get(AciFabricNode, node_id)
+    node = await db.get(AciFabricNode, node_id, options=[_load_fabric_job(AciFabricNode.fabric_job), *strict_loading()])
     if node is None:
         raise HTTPException(status_code=404, detail="Fabric node not found")
     return _serialize_node(node)
@@ -160,7 +199,7 @@ async def get_fabric_node_detail(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ) -> AciFabricNodeDetailRead:
-    node = await db.get(AciFabricNode, node_id)
+    node = await db.get(AciFabricNode, node_id, options=[_load_fabric_job(AciFabricNode.fabric_job), *strict_loading()])
     if node is None:
         raise HTTPException(status_code=404, detail="Fabric node not found")
 
@@ -182,10 +221,13 @@ async def list_fabric_node_interfaces(
     if node is None:
         raise HTTPException(status_code=404, detail="Fabric node not found")
 
+    node_pk = node.id
     result = await db.execute(
-        select(AciFabricNodeInterface)
-        .where(AciFabricNodeInterface.node_id == node.id)
-        .order_by(AciFabricNodeInterface.name)
+        lambda_stmt(
+            lambda: select(AciFabricNodeInterface)
+            .where(AciFabricNodeInterface.node_id == node_pk)
+            .order_by(AciFabricNodeInterface.name)
+        )
     )
     interfaces = result.scalars().all()
     return [AciFabricNodeInterfaceRead.model_validate(item, from_attributes=True) for item in interfaces]
@@ -208,13 +250,15 @@ async def list_fabric_endpoints(
     conditions = []
     stmt = (
         select(AciFabricEndpoint)
-        .options(selectinload(AciFabricEndpoint.fabric_job))
+        .options(_load_fabric_job(AciFabricEndpoint.fabric_job))
         .outerjoin(telco_alias, AciFabricEndpoint.fabric_job_id == telco_alias.id)
         .order_by(AciFabricEndpoint.mac, AciFabricEndpoint.distinguished_name)
     )
-    count_stmt = select(func.count()).select_from(AciFabricEndpoint).outerjoin(
-        telco_alias, AciFabricEndpoint.fabric_job_id == telco_alias.id
-    )
+    # COUNT(id) over the bare table when no filter needs the fabric job, so
+    # PostgreSQL can answer from the primary-key index.
+    count_stmt = select(func.count(AciFabricEndpoint.id)).select_from(AciFabricEndpoint)
+    if fabric or search:
+        count_stmt = count_stmt.outerjoin(telco_alias, AciFabricEndpoint.fabric_job_id == telco_alias.id)
 
     if fabric:
         fabric_pattern = f"%{fabric.strip().lower()}%"
@@ -295,13 +339,15 @@ async def list_fabric_vlans(
     conditions = []
     stmt = (
         select(AciFabricVlan)
-        .options(selectinload(AciFabricVlan.fabric_job))
+        .options(_load_fabric_job(AciFabricVlan.fabric_job))
         .outerjoin(telco_alias, AciFabricVlan.fabric_job_id == telco_alias.id)
         .order_by(AciFabricVlan.vlan_id, AciFabricVlan.encap)
     )
-    count_stmt = select(func.count()).select_from(AciFabricVlan).outerjoin(
-        telco_alias, AciFabricVlan.fabric_job_id == telco_alias.id
-    )
+    # COUNT(id) over the bare table when no filter needs the fabric job, so
+    # PostgreSQL can answer from the primary-key index.
+    count_stmt = select(func.count(AciFabricVlan.id)).select_from(AciFabricVlan)
+    if fabric or search:
+        count_stmt = count_stmt.outerjoin(telco_alias, AciFabricVlan.fabric_job_id == telco_alias.id)
 
     if fabric:
         fabric_pattern = f"%{fabric.strip().lower()}%"
@@ -382,28 +428,33 @@ async def get_fabric_free_ports(
 
     node_result = await db.execute(
         select(AciFabricNode)
-        .options(selectinload(AciFabricNode.fabric_job))
+        .options(_load_fabric_job(AciFabricNode.fabric_job), *strict_loading())
         .where(AciFabricNode.role.in_(switch_roles))
         .order_by(AciFabricNode.name)
     )
     nodes = node_result.scalars().all()
     node_ids = [node.id for node in nodes]
 
-    # Only the down + sfp-missing interfaces are relevant to the report.
-    interfaces_by_node: dict[object, list[AciFabricNodeInterface]] = defaultdict(list)
+    # Only the down + sfp-missing interfaces are relevant to the report, and only their
+    # name/usage: streaming those columns in partitions keeps the interface JSON blobs
+    # and a fabric-wide result set out of memory.
+    interfaces_by_node: dict[object, list] = defaultdict(list)
     if node_ids:
-        iface_result = await db.execute(
-            select(AciFabricNodeInterface).where(
+        iface_result = await db.stream(
+            select(AciFabricNodeInterface.node_id, AciFabricNodeInterface.name, AciFabricNodeInterface.usage)
+            .where(
                 AciFabricNodeInterface.node_id.in_(node_ids),
                 func.lower(AciFabricNodeInterface.oper_state) == "down",
                 func.lower(func.coalesce(AciFabricNodeInterface.oper_st_qual, "")) == "sfp-missing",
             )
+            .execution_options(yield_per=FREE_PORT_STREAM_BATCH)
         )
-        for iface in iface_result.scalars():
-            interfaces_by_node[iface.node_id].append(iface)
+        async for partition in iface_result.partitions():
+            for iface in partition:
+                interfaces_by_node[iface.node_id].append(iface)
 
     node_rows: list[AciFreePortNode] = []
-    fabric_groups: dict[str, dict[str, object]] = {}
+    fabric_groups: dict[object, dict[str, object]] = {}
 
     for node in nodes:
         matches = interfaces_by_node.get(node.id, [])
@@ -427,7 +478,7 @@ async def get_fabric_free_ports(
                 node_id=node.node_id,
                 name=node.name,
                 model=node.model,
-                role=node.role.value if isinstance(node.role, AciNodeRole) else str(node.role),
+                role=node.role.value,
                 pod=node.pod,
                 free=free,
                 excluded=excluded,
@@ -436,12 +487,12 @@ async def get_fabric_free_ports(
             )
         )
 
-        group_key = str(node.fabric_job_id) if node.fabric_job_id else "__unassigned__"
-        summary = fabric_groups.get(group_key)
+        # Unassigned nodes share the None key.
+        summary = fabric_groups.get(node.fabric_job_id)
         if summary is None:
             summary = {
                 "fabric_job_id": node.fabric_job_id,
-                "fabric_name": node.fabric_name or "Unassigned Fabric",
+                "fabric_name": node.fabric_name or UNASSIGNED_FABRIC_NAME,
                 "fabric_ip": node.fabric_ip,
                 "free": 0,
                 "excluded": 0,
@@ -449,7 +500,7 @@ async def get_fabric_free_ports(
                 "nodes_with_free": 0,
                 "total_nodes": 0,
             }
-            fabric_groups[group_key] = summary
+            fabric_groups[node.fabric_job_id] = summary
         summary["free"] = int(summary["free"]) + free
         summary["excluded"] = int(summary["excluded"]) + excluded
         summary["sfp_missing"] = int(summary["sfp_missing"]) + sfp_missing
@@ -488,13 +539,39 @@ async def get_fabric_summary(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ) -> AciFabricNodeSummary:
-    result = await db.execute(select(AciFabricNode))
-    nodes = result.scalars().all()
-    total = len(nodes)
-    role_counts = Counter(node.role for node in nodes)
-    delayed = sum(1 for node in nodes if node.delayed_heartbeat)
-    fabric_states = Counter((node.fabric_state or "unknown") for node in nodes)
-    version_counts = Counter((node.version or "unknown") for node in nodes)
+    return await _summary_cache.get_or_compute(("summary",), lambda: _build_fabric_summary(db))
+
+
+async def _build_fabric_summary(db: AsyncSession) -> AciFabricNodeSummary:
+    # One scan grouped by every dimension; the few resulting combos are folded into
+    # the per-dimension counters in a single pass. lambda_stmt caches the statement's
+    # construction as well as its compiled SQL.
+    rows = await db.execute(
+        lambda_stmt(
+            lambda: select(
+                AciFabricNode.role,
+                _unknown_if_blank(AciFabricNode.fabric_state),
+                _unknown_if_blank(AciFabricNode.version),
+                func.count(),
+                func.count().filter(AciFabricNode.delayed_heartbeat.is_(True)),
+            ).group_by(
+                AciFabricNode.role,
+                _unknown_if_blank(AciFabricNode.fabric_state),
+                _unknown_if_blank(AciFabricNode.version),
+            )
+        )
+    )
+    total = 0
+    delayed = 0
+    role_counts: Counter[AciNodeRole] = Counter()
+    fabric_states: Counter[str] = Counter()
+    version_counts: Counter[str] = Counter()
+    for role, fabric_state, version, count, delayed_count in rows:
+        total += count
+        delayed += delayed_count
+        role_counts[role] += count
+        fabric_states[fabric_state] += count
+        version_counts[version] += count
 
     return AciFabricNodeSummary(
         total=total,
@@ -518,10 +595,30 @@ async def get_fabric_summary_details(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ) -> AciFabricSummaryDetails:
-    stmt = select(AciFabricNode).options(selectinload(AciFabricNode.fabric_job)).order_by(AciFabricNode.name)
+    key = (
+        "details",
+        fabric,
+        tuple(sorted(roles or ())),
+        tuple(sorted(models or ())),
+        tuple(sorted(versions or ())),
+        tuple(sorted(fabric_states or ())),
+    )
+    return await _summary_cache.get_or_compute(
+        key, lambda: _build_fabric_summary_details(db, fabric, roles, models, versions, fabric_states)
+    )
 
+
+async def _build_fabric_summary_details(
+    db: AsyncSession,
+    fabric: Optional[str],
+    roles: Optional[list[AciNodeRole]],
+    models: Optional[list[str]],
+    versions: Optional[list[str]],
+    fabric_states: Optional[list[str]],
+) -> AciFabricSummaryDetails:
+    base_filters = []
     if roles:
-        stmt = stmt.where(AciFabricNode.role.in_(roles))
+        base_filters.append(AciFabricNode.role.in_(roles))
     if fabric_states:
         normalized_states = [state for state in fabric_states if state.lower() != "unknown"]
         include_unknown = any(state.lower() == "unknown" for state in fabric_states)
@@ -531,85 +628,108 @@ async def get_fabric_summary_details(
         if include_unknown:
             state_conditions.append(AciFabricNode.fabric_state.is_(None))
         if state_conditions:
-            stmt = stmt.where(or_(*state_conditions))
-
-    result = await db.execute(stmt)
-    nodes = result.scalars().all()
-
-    available_roles = sorted({node.role.value for node in nodes})
-    available_models_set = {node.model for node in nodes if node.model}
-    available_versions_set = {node.version for node in nodes if node.version}
-    available_states_set = {node.fabric_state for node in nodes if node.fabric_state}
+            base_filters.append(or_(*state_conditions))
+
+    # Filter choices reflect the role/state filters only, so read them before narrowing further.
+    combos = (
+        await db.execute(
+            select(AciFabricNode.role, AciFabricNode.model, AciFabricNode.version, AciFabricNode.fabric_state)
+            .where(*base_filters)
+            .distinct()
+        )
+    ).all()
 
-    has_unknown_model = any(node.model is None for node in nodes)
-    has_unknown_version = any(node.version is None for node in nodes)
-    has_unknown_state = any(node.fabric_state is None for node in nodes)
+    available_roles = sorted({combo.role.value for combo in combos})
+    available_models_set = {combo.model for combo in combos if combo.model}
+    available_versions_set = {combo.version for combo in combos if combo.version}
+    available_states_set = {combo.fabric_state for combo in combos if combo.fabric_state}
 
-    if has_unknown_model:
+    if any(combo.model is None for combo in combos):
         available_models_set.add("unknown")
-    if has_unknown_version:
+    if any(combo.version is None for combo in combos):
         available_versions_set.add("unknown")
-    if has_unknown_state:
+    if any(combo.fabric_state is None for combo in combos):
         available_states_set.add("unknown")
 
     available_models = sorted(available_models_set)
     available_versions = sorted(available_versions_set)
     available_fabric_states = sorted(available_states_set)
 
-    fabric_term = fabric.lower() if fabric else None
-    model_filter = {value.lower() for value in models} if models else None
-    version_filter = {value.lower() for value in versions} if versions else None
+    filters = list(base_filters)
+    if fabric:
+        fabric_term = fabric.lower()
+        filters.append(
+            or_(
+                func.lower(func.coalesce(func.nullif(TelcoFabricOnboardingJob.name, ""), UNASSIGNED_FABRIC_NAME)).contains(
+                    fabric_term, autoescape=True
+                ),
+                func.lower(func.coalesce(TelcoFabricOnboardingJob.target_host, "")).contains(fabric_term, autoescape=True),
+            )
+        )
+    if models:
+        filters.append(func.lower(_unknown_if_blank(AciFabricNode.model)).in_({value.lower() for value in models}))
+    if versions:
+        filters.append(func.lower(_unknown_if_blank(AciFabricNode.version)).in_({value.lower() for value in versions}))
+
+    def grouped(key, *aggregates, sort_key=None):
+        # Rows arrive busiest bucket first (ties by name), so each fabric's counts are
+        # inserted already in display order.
+        return (
+            select(TelcoFabricOnboardingJob.id, key, *aggregates)
+            .select_from(AciFabricNode)
+            .outerjoin(TelcoFabricOnboardingJob, AciFabricNode.fabric_job_id == TelcoFabricOnboardingJob.id)
+            .where(*filters)
+            .group_by(TelcoFabricOnboardingJob.id, key)
+            .order_by(func.count().desc(), sort_key if sort_key is not None else key)
+        )
 
-    filtered_nodes: list[AciFabricNode] = []
-    for node in nodes:
-        if fabric_term:
-            name_candidate = (node.fabric_name or "Unassigned Fabric").lower()
-            ip_candidate = (node.fabric_ip or "").lower()
-            if fabric_term not in name_candidate and fabric_term not in ip_candidate:
-                continue
-        if model_filter:
-            model_value = (node.model or "unknown").lower()
-            if model_value not in model_filter:
-                continue
-        if version_filter:
-            version_value = (node.version or "unknown").lower()
-            if version_value not in version_filter:
-                continue
-        filtered_nodes.append(node)
-
-    fabric_groups: dict[str, dict[str, object]] = {}
-
-    for node in filtered_nodes:
-        fabric_job = node.fabric_job
-        group_key = str(fabric_job.id) if fabric_job else "__unassigned__"
-        summary = fabric_groups.get(group_key)
+    # The job's display fields ride along in the role query (functionally dependent on
+    # its id), so no separate lookup of fabric jobs is needed.
+    fabric_groups: dict[object, dict[str, object]] = {}
+    role_rows = await db.execute(
+        grouped(
+            AciFabricNode.role,
+            func.count(),
+            func.count().filter(AciFabricNode.delayed_heartbeat.is_(True)),
+            TelcoFabricOnboardingJob.name,
+            TelcoFabricOnboardingJob.target_host,
+            TelcoFabricOnboardingJob.last_polled_at,
+            # PostgreSQL orders native enums by declaration; sort on the label instead.
+            sort_key=func.cast(AciFabricNode.role, String),
+        ).group_by(
+            TelcoFabricOnboardingJob.name,
+            TelcoFabricOnboardingJob.target_host,
+            TelcoFabricOnboardingJob.last_polled_at,
+        )
+    )
+    for job_id, role, count, delayed_count, job_name, job_ip, last_polled_at in role_rows:
+        summary = fabric_groups.get(job_id)
         if summary is None:
             summary = {
-                "fabric_job_id": fabric_job.id if fabric_job else None,
-                "fabric_name": node.fabric_name or "Unassigned Fabric",
-                "fabric_ip": node.fabric_ip,
+                "fabric_job_id": job_id,
+                "fabric_name": job_name or UNASSIGNED_FABRIC_NAME,
+                "fabric_ip": job_ip,
+                "last_polled_at": last_polled_at,
                 "total_nodes": 0,
                 "delayed_heartbeat": 0,
-                "by_role": defaultdict(int),
-                "by_model": defaultdict(int),
-                "by_version": defaultdict(int),
-                "by_fabric_state": defaultdict(int),
-                "last_polled_at": fabric_job.last_polled_at if fabric_job else None,
+                "by_role": {},
+                "by_model": {},
+                "by_version": {},
+                "by_fabric_state": {},
             }
-            fabric_groups[group_key] = summary
-
-        summary["total_nodes"] = int(summary["total_nodes"]) + 1
-        if node.delayed_heartbeat:
-            summary["delayed_heartbeat"] = int(summary["delayed_heartbeat"]) + 1
-
-        role_key = node.role.value if isinstance(node.role, AciNodeRole) else str(node.role)
-        summary["by_role"][role_key] += 1
-        summary["by_model"][node.model or "unknown"] += 1
-        summary["by_version"][node.version or "unknown"] += 1
-        summary["by_fabric_state"][node.fabric_state or "unknown"] += 1
-
-        if fabric_job and summary.get("last_polled_at") is None:
-            summary["last_polled_at"] = fabric_job.last_polled_at
+            fabric_groups[job_id] = summary
+        summary["total_nodes"] += count
+        summary["delayed_heartbeat"] += delayed_count
+        summary["by_role"][role.value] = count
+
+    for column, field in (
+        (AciFabricNode.model, "by_model"),
+        (AciFabricNode.version, "by_version"),
+        (AciFabricNode.fabric_state, "by_fabric_state"),
+    ):
+        bucket = _unknown_if_blank(column)
+        for job_id, key, count in await db.execute(grouped(bucket, func.count())):
+            fabric_groups[job_id][field][key] = count
 
     fabrics: list[AciFabricSummaryFabric] = []
     for value in fabric_groups.values():
@@ -620,10 +740,10 @@ async def get_fabric_summary_details(
                 fabric_ip=value["fabric_ip"],
                 total_nodes=value["total_nodes"],
                 delayed_heartbeat=value["delayed_heartbeat"],
-                by_role=dict(sorted(value["by_role"].items(), key=lambda item: (-item[1], item[0]))),
-                by_model=dict(sorted(value["by_model"].items(), key=lambda item: (-item[1], item[0]))),
-                by_version=dict(sorted(value["by_version"].items(), key=lambda item: (-item[1], item[0]))),
-                by_fabric_state=dict(sorted(value["by_fabric_state"].items(), key=lambda item: (-item[1], item[0]))),
+                by_role=value["by_role"],
+                by_model=value["by_model"],
+                by_version=value["by_version"],
+                by_fabric_state=value["by_fabric_state"],
                 last_polled_at=value["last_polled_at"],
             )
         )
@@ -631,7 +751,7 @@ async def get_fabric_summary_details(
     fabrics.sort(key=lambda item: (-item.total_nodes, item.fabric_name.lower()))
 
     return AciFabricSummaryDetails(
-        total_nodes=len(filtered_nodes),
+        total_nodes=sum(item.total_nodes for item in fabrics),
         total_fabrics=len(fabrics),
         fabrics=fabrics,
         available_roles=available_roles,
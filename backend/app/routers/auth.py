@@ -1,3 +1,4 @@
+import asyncio
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -6,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.security import create_access_token, get_password_hash
-from app.dependencies import get_current_user, get_db, require_admin
+from app.dependencies import get_auth_db, get_current_user, require_admin
 from app.models import User, UserRoleEnum
 from app.schemas.auth import TokenPair
 from app.schemas.user import UserCreate, UserRead
@@ -17,7 +18,7 @@ settings = get_settings()
 
 
 @router.post("/login", response_model=TokenPair)
-async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_auth_db)):
     user = await authenticate_user(db, form_data.username, form_data.password)
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password")
@@ -26,8 +27,8 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSessi
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def register_user(user_in: UserCreate, db: AsyncSession = Depends(get_db), _: User = Depends(require_admin)):
-    hashed_password = get_password_hash(user_in.password)
+async def register_user(user_in: UserCreate, db: AsyncSession = Depends(get_auth_db), _: User = Depends(require_admin)):
+    hashed_password = await asyncio.to_thread(get_password_hash, user_in.password)
     user = User(
         email=user_in.email,
         full_name=user_in.full_name,
@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.database import strict_loading
 from app.dependencies import get_db, get_current_user
 from app.models import Group, System
 from app.schemas.group import GroupCreate, GroupDetail, GroupRead, GroupUpdate
@@ -31,7 +32,11 @@ async def create_group(payload: GroupCreate, db: AsyncSession = Depends(get_db),
 
 @router.get("/{group_id}", response_model=GroupDetail)
 async def get_group(group_id: UUID, db: AsyncSession = Depends(get_db), _: object = Depends(get_current_user)):
-    stmt = select(Group).options(selectinload(Group.systems).selectinload(System.credentials)).where(Group.id == group_id)
+    stmt = (
+        select(Group)
+        .options(selectinload(Group.systems).selectinload(System.credentials), *strict_loading())
+        .where(Group.id == group_id)
+    )
     result = await db.execute(stmt)
     group = result.scalar_one_or_none()
     if group is None:
@@ -5,9 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.database import strict_loading
 from app.core.security import create_access_token
 from app.dependencies import get_current_user, get_db
-from app.models import System
+from app.models import System, SystemCredential
 from app.models.system import AccessType as ModelAccessType
 from app.services.crypto import decrypt_secret
 
@@ -16,17 +17,14 @@ router = APIRouter(prefix="/gui", tags=["gui"])
 
 @router.post("/{system_id}/token")
 async def issue_gui_token(system_id: UUID, db: AsyncSession = Depends(get_db), _: object = Depends(get_current_user)):
-    system = await db.get(System, system_id, options=[selectinload(System.credentials)])
+    # Only GUI-capable credentials are loaded; CLI-only secrets never leave the database.
+    gui_credentials = System.credentials.and_(
+        SystemCredential.access_scope.in_((ModelAccessType.GUI, ModelAccessType.BOTH))
+    )
+    system = await db.get(System, system_id, options=[selectinload(gui_credentials), *strict_loading()])
     if system is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="System not found")
-    credential = next(
-        (
-            cred
-            for cred in system.credentials
-            if cred.access_scope in {ModelAccessType.GUI, ModelAccessType.BOTH}
-        ),
-        None,
-    )
+    credential = system.credentials[0] if system.credentials else None
     if credential is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No GUI credential available")
     if not credential.login_endpoint:
@@ -1,21 +1,30 @@
 import asyncio
-from typing import List, Optional
+import base64
+import binascii
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Type, TypeVar
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel
+from sqlalchemy import delete, func, lambda_stmt, literal, select, tuple_, update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
+from app.core import database
+from app.core.cache import WriteVersionedCache
 from app.dependencies import get_current_user, get_db, require_admin
 from app.models import (
     InventoryDatastore,
     InventoryEndpoint,
-    InventoryEndpointStatus,
     InventoryHost,
     InventoryHostNic,
     InventoryHostPortgroup,
     InventoryNetwork,
+    InventorySyncJob,
+    InventorySyncJobStatus,
     InventoryVirtualMachine,
 )
 from app.schemas import (
@@ -30,119 +39,134 @@ from app.schemas import (
     InventoryVmTopology,
     InventoryNetworkRead,
     InventoryVMRead,
+    InventorySyncJobRead,
 )
-from app.services.crypto import decrypt_secret, encrypt_secret
+from app.services.crypto import decrypt_secret_cached, encrypt_secret, forget_secret
 from app.services.inventory_poller import PollResult, run_poll_for_endpoint
-from app.services.vsphere import VsphereSnapshot, collect_inventory
+from app.services.vsphere import VsphereSnapshot, collect_inventory_async
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
+logger = logging.getLogger(__name__)
 
+# Dashboards re-read the inventory lists far more often than polls change them.
+# Endpoint names appear in every list, so any committed inventory write drops them all.
+LIST_CACHE_TTL_SECONDS = 15
+_list_cache = WriteVersionedCache(
+    InventoryEndpoint,
+    InventoryHost,
+    InventoryVirtualMachine,
+    InventoryDatastore,
+    InventoryNetwork,
+    ttl=LIST_CACHE_TTL_SECONDS,
+)
 
-def _serialize_endpoint(endpoint: InventoryEndpoint) -> InventoryEndpointRead:
-    return InventoryEndpointRead(
-        id=str(endpoint.id),
-        name=endpoint.name,
-        address=endpoint.address,
-        port=endpoint.port,
-        source_type=endpoint.source_type,
-        username=endpoint.username,
-        verify_ssl=endpoint.verify_ssl,
-        poll_interval_seconds=endpoint.poll_interval_seconds,
-        description=endpoint.description,
-        tags=list(endpoint.tags or []),
-        last_polled_at=endpoint.last_polled_at,
-        last_poll_status=endpoint.last_poll_status or InventoryEndpointStatus.NEVER,
-        last_error_message=endpoint.last_error_message,
-        has_credentials=bool(endpoint.password_secret),
-        created_at=endpoint.created_at,
-        updated_at=endpoint.updated_at,
-    )
+# The host/VM/datastore/network lists accept an optional ``limit`` and keyset
+# ``cursor``; the cursor for the following page comes back in this header so the
+# response body stays a plain list for existing clients.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+LIST_STREAM_BATCH = 256
 
+# Endpoints polled at once by sync-all; the vSphere collections themselves are further
+# bounded by the collector process pool.
+SYNC_ALL_CONCURRENCY = 8
 
-def _serialize_host(host: InventoryHost) -> InventoryHostRead:
-    endpoint = host.endpoint
-    return InventoryHostRead(
-        id=str(host.id),
-        endpoint_id=str(host.endpoint_id),
-        endpoint_name=endpoint.name if endpoint else "Unknown",
-        name=host.name,
-        serial=host.serial,
-        cluster=host.cluster,
-        hardware_model=host.hardware_model,
-        vendor=host.vendor,
-        cpu_model=host.cpu_model,
-        bios_version=host.bios_version,
-        esxi_version=host.esxi_version,
-        management_ip=host.management_ip,
-        site_name=host.site_name,
-        rack_location=host.rack_location,
-        connection_state=host.connection_state,
-        power_state=host.power_state,
-        cpu_cores=host.cpu_cores,
-        cpu_usage_mhz=host.cpu_usage_mhz,
-        memory_total_mb=host.memory_total_mb,
-        memory_usage_mb=host.memory_usage_mb,
-        datastore_total_gb=host.datastore_total_gb,
-        datastore_free_gb=host.datastore_free_gb,
-        uptime_seconds=host.uptime_seconds,
-        last_seen_at=host.last_seen_at,
-        updated_at=host.updated_at,
-    )
+# Sync jobs run in-process, so a worker restart can orphan one in pending/running.
+# Past this age such a job is reported as failed; finished jobs are pruned after the
+# retention window whenever a new sync is requested.
+SYNC_JOB_STALE_AFTER = timedelta(minutes=15)
+SYNC_JOB_RETENTION = timedelta(days=7)
+SYNC_JOB_STALE_MESSAGE = "Sync job did not finish; the server may have restarted"
+_UNFINISHED_SYNC_STATES = (InventorySyncJobStatus.PENDING, InventorySyncJobStatus.RUNNING)
 
+_ReadT = TypeVar("_ReadT", bound=BaseModel)
 
-def _serialize_vm(vm: InventoryVirtualMachine) -> InventoryVMRead:
-    endpoint = vm.endpoint
-    host = vm.host
-    return InventoryVMRead(
-        id=str(vm.id),
-        endpoint_id=str(vm.endpoint_id),
-        endpoint_name=endpoint.name if endpoint else "Unknown",
-        host_id=str(host.id) if host else None,
-        host_name=host.name if host else None,
-        name=vm.name,
-        guest_os=vm.guest_os,
-        power_state=vm.power_state,
-        cpu_count=vm.cpu_count,
-        memory_mb=vm.memory_mb,
-        cpu_usage_mhz=vm.cpu_usage_mhz,
-        memory_usage_mb=vm.memory_usage_mb,
-        provisioned_storage_gb=vm.provisioned_storage_gb,
-        used_storage_gb=vm.used_storage_gb,
-        ip_address=vm.ip_address,
-        datastores=list(vm.datastores or []),
-        networks=list(vm.networks or []),
-        tools_status=vm.tools_status,
-        is_template=vm.is_template,
-        last_seen_at=vm.last_seen_at,
-        updated_at=vm.updated_at,
-    )
+# PATCH coercions per InventoryEndpointUpdate field; returning _KEEP leaves the column
+# as is (blank strings and explicit nulls for required columns). ``password`` is
+# handled separately because it is stored encrypted as ``password_secret``.
+_KEEP = object()
 
 
-def _serialize_datastore(datastore: InventoryDatastore) -> InventoryDatastoreRead:
-    endpoint = datastore.endpoint
-    return InventoryDatastoreRead(
-        id=str(datastore.id),
-        endpoint_id=str(datastore.endpoint_id),
-        endpoint_name=endpoint.name if endpoint else "Unknown",
-        name=datastore.name,
-        type=datastore.type,
-        capacity_gb=datastore.capacity_gb,
-        free_gb=datastore.free_gb,
-        last_seen_at=datastore.last_seen_at,
-        updated_at=datastore.updated_at,
-    )
+def _stripped_or_keep(value: Optional[str]) -> Any:
+    return value.strip() if value else _KEEP
 
 
-def _serialize_network(network: InventoryNetwork) -> InventoryNetworkRead:
-    endpoint = network.endpoint
-    return InventoryNetworkRead(
-        id=str(network.id),
-        endpoint_id=str(network.endpoint_id),
-        endpoint_name=endpoint.name if endpoint else "Unknown",
-        name=network.name,
-        last_seen_at=network.last_seen_at,
-        updated_at=network.updated_at,
-    )
+def _value_or_keep(value: Any) -> Any:
+    return _KEEP if value is None else value
+
+
+_ENDPOINT_APPLIERS: dict[str, Callable[[Any], Any]] = {
+    "name": _stripped_or_keep,
+    "address": _stripped_or_keep,
+    "username": _stripped_or_keep,
+    "port": _value_or_keep,
+    "source_type": _value_or_keep,
+    "poll_interval_seconds": _value_or_keep,
+    "verify_ssl": bool,
+    "description": lambda value: value.strip() if value else None,
+    "tags": lambda value: _KEEP if value is None else [tag.strip() for tag in value if tag.strip()],
+}
+
+
+def _encode_cursor(name: str, row_id: UUID) -> str:
+    return base64.urlsafe_b64encode(f"{row_id}:{name}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, UUID]:
+    try:
+        raw_id, _, name = base64.urlsafe_b64decode(cursor.encode()).decode().partition(":")
+        return name, UUID(raw_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from None
+
+
+async def _fetch_page(
+    db: AsyncSession,
+    stmt: StatementLambdaElement,
+    model,
+    schema: Type[_ReadT],
+    limit: Optional[int],
+    cursor: Optional[str],
+) -> tuple[list[_ReadT], Optional[str]]:
+    """Run a name-ordered list query, optionally as one keyset page after ``cursor``."""
+
+    stmt += lambda s: s.order_by(model.name, model.id)
+    if cursor:
+        name, last_id = _decode_cursor(cursor)
+        # Bind the id with the column type; a bare UUID binds as the generic Uuid
+        # (dashless hex on SQLite), which does not compare like the stored GUID text.
+        after_cursor = tuple_(model.name, model.id) > tuple_(literal(name), literal(last_id, model.id.type))
+        stmt += lambda s: s.where(after_cursor)
+    if limit is not None:
+        # One extra row tells us whether another page follows.
+        fetch = limit + 1
+        stmt += lambda s: s.limit(fetch)
+    # Validate rows as they stream in so a full-fleet list never holds every ORM
+    # object and its schema copy at the same time.
+    result = await db.stream_scalars(stmt, execution_options={"yield_per": LIST_STREAM_BATCH})
+    items: list[_ReadT] = []
+    next_cursor = None
+    async for row in result:
+        if limit is not None and len(items) == limit:
+            next_cursor = _encode_cursor(items[-1].name, items[-1].id)
+            break
+        items.append(schema.model_validate(row))
+    await result.close()
+    return items, next_cursor
+
+
+async def _get_endpoint_or_404(db: AsyncSession, endpoint_id: UUID) -> InventoryEndpoint:
+    endpoint = await db.get(InventoryEndpoint, endpoint_id)
+    if endpoint is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory endpoint not found")
+    return endpoint
+
+
+async def _cached_page(key: tuple, response: Response, load) -> list:  # noqa: ANN001 - async loader
+    items, next_cursor = await _list_cache.get_or_compute(key, load)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
 
 
 def _build_validation_result(
@@ -183,8 +207,7 @@ async def _validate_endpoint_connection(
     verify_ssl: bool,
 ) -> InventoryEndpointValidationResult:
     try:
-        snapshot = await asyncio.to_thread(
-            collect_inventory,
+        snapshot = await collect_inventory_async(
             address,
             port,
             username,
@@ -202,9 +225,11 @@ async def list_endpoints(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ):
-    result = await db.execute(select(InventoryEndpoint).order_by(InventoryEndpoint.name))
-    endpoints = result.scalars().all()
-    return [_serialize_endpoint(endpoint) for endpoint in endpoints]
+    async def load() -> list[InventoryEndpointRead]:
+        result = await db.execute(select(InventoryEndpoint).order_by(InventoryEndpoint.name))
+        return [InventoryEndpointRead.model_validate(endpoint) for endpoint in result.scalars()]
+
+    return await _list_cache.get_or_compute(("endpoints",), load)
 
 
 @router.post("/endpoints", response_model=InventoryEndpointRead, status_code=status.HTTP_201_CREATED)
@@ -227,8 +252,7 @@ async def create_endpoint(
     )
     db.add(endpoint)
     await db.commit()
-    await db.refresh(endpoint)
-    return _serialize_endpoint(endpoint)
+    return InventoryEndpointRead.model_validate(endpoint)
 
 
 @router.post("/endpoints/validate", response_model=InventoryEndpointValidationResult)
@@ -251,10 +275,8 @@ async def get_endpoint(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ):
-    endpoint = await db.get(InventoryEndpoint, endpoint_id)
-    if endpoint is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory endpoint not found")
-    return _serialize_endpoint(endpoint)
+    endpoint = await _get_endpoint_or_404(db, endpoint_id)
+    return InventoryEndpointRead.model_validate(endpoint)
 
 
 @router.patch("/endpoints/{endpoint_id}", response_model=InventoryEndpointRead)
@@ -264,35 +286,22 @@ async def update_endpoint(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(require_admin),
 ):
-    endpoint = await db.get(InventoryEndpoint, endpoint_id)
-    if endpoint is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory endpoint not found")
+    endpoint = await _get_endpoint_or_404(db, endpoint_id)
 
     updates = payload.model_dump(exclude_unset=True)
-    if "name" in updates and updates["name"]:
-        endpoint.name = updates["name"].strip()
-    if "address" in updates and updates["address"]:
-        endpoint.address = updates["address"].strip()
-    if "port" in updates and updates["port"] is not None:
-        endpoint.port = updates["port"]
-    if "source_type" in updates and updates["source_type"] is not None:
-        endpoint.source_type = updates["source_type"]
-    if "username" in updates and updates["username"]:
-        endpoint.username = updates["username"].strip()
-    if "verify_ssl" in updates:
-        endpoint.verify_ssl = bool(updates["verify_ssl"])
-    if "poll_interval_seconds" in updates and updates["poll_interval_seconds"] is not None:
-        endpoint.poll_interval_seconds = updates["poll_interval_seconds"]
-    if "description" in updates:
-        endpoint.description = updates["description"].strip() if updates["description"] else None
-    if "tags" in updates and updates["tags"] is not None:
-        endpoint.tags = [tag.strip() for tag in updates["tags"] if tag.strip()]
-    if "password" in updates and updates["password"]:
-        endpoint.password_secret = encrypt_secret(updates["password"])
+    password = updates.pop("password", None)
+    for field, value in updates.items():
+        value = _ENDPOINT_APPLIERS[field](value)
+        if value is not _KEEP:
+            setattr(endpoint, field, value)
+    if password:
+        forget_secret(endpoint.password_secret)
+        endpoint.password_secret = encrypt_secret(password)
 
-    await db.commit()
-    await db.refresh(endpoint)
-    return _serialize_endpoint(endpoint)
+    # Re-sending the current values leaves nothing to write; skip the commit round trip.
+    if db.is_modified(endpoint):
+        await db.commit()
+    return InventoryEndpointRead.model_validate(endpoint)
 
 
 @router.post("/endpoints/{endpoint_id}/test", response_model=InventoryEndpointValidationResult)
@@ -301,11 +310,9 @@ async def test_endpoint_connectivity(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(require_admin),
 ):
-    endpoint = await db.get(InventoryEndpoint, endpoint_id)
-    if endpoint is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory endpoint not found")
+    endpoint = await _get_endpoint_or_404(db, endpoint_id)
 
-    password = decrypt_secret(endpoint.password_secret)
+    password = decrypt_secret_cached(endpoint.password_secret)
     return await _validate_endpoint_connection(
         endpoint.address,
         endpoint.port,
@@ -315,29 +322,114 @@ async def test_endpoint_connectivity(
     )
 
 
+def _sync_job_is_stale(job: InventorySyncJob, now: datetime) -> bool:
+    if job.status not in _UNFINISHED_SYNC_STATES:
+        return False
+    # Running jobs age from when the poll began; pending ones from when they were queued.
+    since = job.started_at or job.created_at
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return now - since > SYNC_JOB_STALE_AFTER
+
+
+async def _expire_sync_jobs(db: AsyncSession) -> None:
+    now = datetime.now(timezone.utc)
+    await db.execute(
+        update(InventorySyncJob)
+        .where(
+            InventorySyncJob.status.in_(_UNFINISHED_SYNC_STATES),
+            func.coalesce(InventorySyncJob.started_at, InventorySyncJob.created_at) < now - SYNC_JOB_STALE_AFTER,
+        )
+        .values(status=InventorySyncJobStatus.ERROR, error_message=SYNC_JOB_STALE_MESSAGE, finished_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        delete(InventorySyncJob)
+        .where(InventorySyncJob.created_at < now - SYNC_JOB_RETENTION)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _run_sync_job(job_id: UUID) -> None:
+    async with database.AsyncSessionLocal() as session:
+        job = await session.get(InventorySyncJob, job_id, options=[joinedload(InventorySyncJob.endpoint)])
+        if job is None:  # endpoint (and its jobs) deleted before the task started
+            return
+        job.mark_running()
+        await session.commit()
+        try:
+            poll_result = await run_poll_for_endpoint(session, job.endpoint)
+            job.mark_done(_summary_from_poll_result(poll_result).model_dump(mode="json"))
+            await session.commit()
+        except Exception as exc:
+            logger.exception("Inventory sync job failed", extra={"job": str(job_id)})
+            await session.rollback()
+            await session.refresh(job)
+            job.mark_failed(str(exc))
+            await session.commit()
+
+
 @router.post(
     "/endpoints/{endpoint_id}/sync",
-    response_model=InventoryEndpointSyncResponse,
-    status_code=status.HTTP_200_OK,
+    response_model=InventorySyncJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def sync_endpoint_now(
     endpoint_id: UUID,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     _: object = Depends(require_admin),
 ):
-    endpoint = await db.get(InventoryEndpoint, endpoint_id)
-    if endpoint is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory endpoint not found")
+    endpoint = await _get_endpoint_or_404(db, endpoint_id)
 
-    poll_result = await run_poll_for_endpoint(db, endpoint)
+    # A poll is seconds of vSphere I/O; run it after responding and let clients
+    # follow the job through GET /sync-jobs/{job_id}.
+    await _expire_sync_jobs(db)
+    job = InventorySyncJob(endpoint_id=endpoint.id)
+    db.add(job)
     await db.commit()
-    await db.refresh(endpoint)
+    background_tasks.add_task(_run_sync_job, job.id)
+    return InventorySyncJobRead.model_validate(job)
+
+
+@router.get("/sync-jobs/{job_id}", response_model=InventorySyncJobRead)
+async def get_sync_job(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    _: object = Depends(require_admin),
+):
+    job = await db.get(InventorySyncJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory sync job not found")
+    if _sync_job_is_stale(job, datetime.now(timezone.utc)):
+        job.mark_failed(SYNC_JOB_STALE_MESSAGE)
+        await db.commit()
+    return InventorySyncJobRead.model_validate(job)
 
-    summary = _summary_from_poll_result(poll_result)
-    return InventoryEndpointSyncResponse(
-        endpoint=_serialize_endpoint(endpoint),
-        summary=summary,
-    )
+
+@router.post("/endpoints/sync-all", response_model=List[InventoryEndpointSyncResponse])
+async def sync_all_endpoints(
+    db: AsyncSession = Depends(get_db),
+    _: object = Depends(require_admin),
+):
+    endpoint_ids = (await db.execute(select(InventoryEndpoint.id).order_by(InventoryEndpoint.name))).scalars().all()
+    semaphore = asyncio.Semaphore(SYNC_ALL_CONCURRENCY)
+
+    async def sync_one(endpoint_id: UUID) -> Optional[InventoryEndpointSyncResponse]:
+        # A session per poll: one AsyncSession cannot run statements concurrently.
+        async with semaphore, database.AsyncSessionLocal() as session:
+            endpoint = await session.get(InventoryEndpoint, endpoint_id)
+            if endpoint is None:  # deleted since the id list was read
+                return None
+            poll_result = await run_poll_for_endpoint(session, endpoint)
+            await session.commit()
+            return InventoryEndpointSyncResponse(
+                endpoint=InventoryEndpointRead.model_validate(endpoint),
+                summary=_summary_from_poll_result(poll_result),
+            )
+
+    results = await asyncio.gather(*(sync_one(endpoint_id) for endpoint_id in endpoint_ids))
+    return [result for result in results if result is not None]
 
 
 @router.delete("/endpoints/{endpoint_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -346,9 +438,8 @@ async def delete_endpoint(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(require_admin),
 ):
-    endpoint = await db.get(InventoryEndpoint, endpoint_id)
-    if endpoint is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory endpoint not found")
+    endpoint = await _get_endpoint_or_404(db, endpoint_id)
+    forget_secret(endpoint.password_secret)
     await db.delete(endpoint)
     await db.commit()
     return None
@@ -356,16 +447,20 @@ async def delete_endpoint(
 
 @router.get("/hosts", response_model=List[InventoryHostRead])
 async def list_hosts(
+    response: Response,
     endpoint_id: Optional[UUID] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ):
-    stmt = select(InventoryHost).options(selectinload(InventoryHost.endpoint)).order_by(InventoryHost.name)
-    if endpoint_id:
-        stmt = stmt.where(InventoryHost.endpoint_id == endpoint_id)
-    result = await db.execute(stmt)
-    hosts = result.scalars().all()
-    return [_serialize_host(host) for host in hosts]
+    async def load():
+        stmt = lambda_stmt(lambda: select(InventoryHost).options(joinedload(InventoryHost.endpoint)))
+        if endpoint_id:
+            stmt += lambda s: s.where(InventoryHost.endpoint_id == endpoint_id)
+        return await _fetch_page(db, stmt, InventoryHost, InventoryHostRead, limit, cursor)
+
+    return await _cached_page(("hosts", endpoint_id, limit, cursor), response, load)
 
 
 @router.get("/hosts/{host_id}", response_model=InventoryHostRead)
@@ -374,11 +469,11 @@ async def get_host(
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ):
-    stmt = select(InventoryHost).options(selectinload(InventoryHost.endpoint)).where(InventoryHost.id == host_id)
+    stmt = select(InventoryHost).options(joinedload(InventoryHost.endpoint)).where(InventoryHost.id == host_id)
     host = (await db.execute(stmt)).scalars().first()
     if host is None:
         raise HTTPException(status_code=404, detail="Host not found")
-    return _serialize_host(host)
+    return InventoryHostRead.model_validate(host)
 
 
 @router.get("/hosts/{host_id}/nics", response_model=List[InventoryHostNicRead])
@@ -397,23 +492,27 @@ async def list_host_nics(
 
 @router.get("/virtual-machines", response_model=List[InventoryVMRead])
 async def list_virtual_machines(
+    response: Response,
     endpoint_id: Optional[UUID] = None,
     host_id: Optional[UUID] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ):
-    stmt = (
-        select(InventoryVirtualMachine)
-        .options(selectinload(InventoryVirtualMachine.endpoint), selectinload(InventoryVirtualMachine.host))
-        .order_by(InventoryVirtualMachine.name)
-    )
-    if endpoint_id:
-        stmt = stmt.where(InventoryVirtualMachine.endpoint_id == endpoint_id)
-    if host_id:
-        stmt = stmt.where(InventoryVirtualMachine.host_id == host_id)
-    result = await db.execute(stmt)
-    vms = result.scalars().all()
-    return [_serialize_vm(vm) for vm in vms]
+    async def load():
+        stmt = lambda_stmt(
+            lambda: select(InventoryVirtualMachine).options(
+                joinedload(InventoryVirtualMachine.endpoint), joinedload(InventoryVirtualMachine.host)
+            )
+        )
+        if endpoint_id:
+            stmt += lambda s: s.where(InventoryVirtualMachine.endpoint_id == endpoint_id)
+        if host_id:
+            stmt += lambda s: s.where(InventoryVirtualMachine.host_id == host_id)
+        return await _fetch_page(db, stmt, InventoryVirtualMachine, InventoryVMRead, limit, cursor)
+
+    return await _cached_page(("virtual_machines", endpoint_id, host_id, limit, cursor), response, load)
 
 
 @router.get("/virtual-machines/{vm_id}", response_model=InventoryVMRead)
@@ -424,13 +523,13 @@ async def get_virtual_machine(
 ):
     stmt = (
         select(InventoryVirtualMachine)
-        .options(selectinload(InventoryVirtualMachine.endpoint), selectinload(InventoryVirtualMachine.host))
+        .options(joinedload(InventoryVirtualMachine.endpoint), joinedload(InventoryVirtualMachine.host))
         .where(InventoryVirtualMachine.id == vm_id)
     )
     vm = (await db.execute(stmt)).scalars().first()
     if vm is None:
         raise HTTPException(status_code=404, detail="Virtual machine not found")
-    return _serialize_vm(vm)
+    return InventoryVMRead.model_validate(vm)
 
 
 @router.get("/virtual-machines/{vm_id}/topology", response_model=InventoryVmTopology)
@@ -443,7 +542,7 @@ async def get_virtual_machine_topology(
     vm = (
         await db.execute(
             select(InventoryVirtualMachine)
-            .options(selectinload(InventoryVirtualMachine.host))
+            .options(joinedload(InventoryVirtualMachine.host))
             .where(InventoryVirtualMachine.id == vm_id)
         )
     ).scalars().first()
@@ -503,27 +602,35 @@ async def get_virtual_machine_topology(
 
 @router.get("/datastores", response_model=List[InventoryDatastoreRead])
 async def list_datastores(
+    response: Response,
     endpoint_id: Optional[UUID] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ):
-    stmt = select(InventoryDatastore).options(selectinload(InventoryDatastore.endpoint)).order_by(InventoryDatastore.name)
-    if endpoint_id:
-        stmt = stmt.where(InventoryDatastore.endpoint_id == endpoint_id)
-    result = await db.execute(stmt)
-    datastores = result.scalars().all()
-    return [_serialize_datastore(datastore) for datastore in datastores]
+    async def load():
+        stmt = lambda_stmt(lambda: select(InventoryDatastore).options(joinedload(InventoryDatastore.endpoint)))
+        if endpoint_id:
+            stmt += lambda s: s.where(InventoryDatastore.endpoint_id == endpoint_id)
+        return await _fetch_page(db, stmt, InventoryDatastore, InventoryDatastoreRead, limit, cursor)
+
+    return await _cached_page(("datastores", endpoint_id, limit, cursor), response, load)
 
 
 @router.get("/networks", response_model=List[InventoryNetworkRead])
 async def list_networks(
+    response: Response,
     endpoint_id: Optional[UUID] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     _: object = Depends(get_current_user),
 ):
-    stmt = select(InventoryNetwork).options(selectinload(InventoryNetwork.endpoint)).order_by(InventoryNetwork.name)
-    if endpoint_id:
-        stmt = stmt.where(InventoryNetwork.endpoint_id == endpoint_id)
-    result = await db.execute(stmt)
-    networks = result.scalars().all()
-    return [_serialize_network(network) for network in networks]
\ No newline at end of file
+    async def load():
+        stmt = lambda_stmt(lambda: select(InventoryNetwork).options(joinedload(InventoryNetwork.endpoint)))
+        if endpoint_id:
+            stmt += lambda s: s.where(InventoryNetwork.endpoint_id == endpoint_id)
+        return await _fetch_page(db, stmt, InventoryNetwork, InventoryNetworkRead, limit, cursor)
+
+    return await _cached_page(("networks", endpoint_id, limit, cursor), response, load)
\ No newline at end of file
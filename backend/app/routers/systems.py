@@ -22,6 +22,15 @@ from app.services.crypto import decrypt_secret, encrypt_secret
 router = APIRouter(prefix="/systems", tags=["systems"])
 
 
+def _derive_access_type(credentials: List[SystemCredential]) -> ModelAccessType:
+    scopes = {cred.access_scope for cred in credentials}
+    if ModelAccessType.GUI in scopes and ModelAccessType.CLI in scopes:
+        return ModelAccessType.BOTH
+    if ModelAccessType.CLI in scopes:
+        return ModelAccessType.CLI
+    return ModelAccessType.GUI
+
+
 @router.get("/", response_model=List[SystemRead])
 async def list_systems(
     group_id: Optional[UUID] = None,
@@ -59,12 +68,13 @@ async def list_systems(
             )
             filters.append(System.id.in_(subquery))
     if join_credentials:
-        stmt = stmt.outerjoin(SystemCredential)
-    if filters:
+        # Match ids through the credential join, then load each system once; avoids a
+        # DISTINCT over full system rows fanned out by their credentials.
+        matching_ids = select(System.id).outerjoin(SystemCredential).where(and_(*filters))
+        stmt = stmt.where(System.id.in_(matching_ids))
+    elif filters:
         stmt = stmt.where(and_(*filters))
-    if join_credentials:
-        stmt = stmt.distinct(System.id)
-    stmt = stmt.options(selectinload(System.credentials))
+    stmt = stmt.options(selectinload(System.credentials)).order_by(System.name)
     result = await db.execute(stmt)
     systems = result.scalars().all()
     return systems
@@ -97,20 +107,10 @@ async def create_system(
         )
         for cred in payload.credentials
     ]
-    scopes = {cred.access_scope for cred in system.credentials}
-    if ModelAccessType.GUI in scopes and ModelAccessType.CLI in scopes:
-        system.access_type = ModelAccessType.BOTH
-    elif ModelAccessType.GUI in scopes:
-        system.access_type = ModelAccessType.GUI
-    elif ModelAccessType.CLI in scopes:
-        system.access_type = ModelAccessType.CLI
-    else:
-        system.access_type = ModelAccessType.GUI
+    system.access_type = _derive_access_type(system.credentials)
     db.add(system)
     await db.commit()
-    stmt = select(System).options(selectinload(System.credentials)).where(System.id == system.id)
-    result = await db.execute(stmt)
-    return result.scalar_one()
+    return system
 
 
 @router.patch("/{system_id}", response_model=SystemRead)
@@ -159,19 +159,9 @@ async def update_system(
                 )
         system.credentials = [cred for cred in system.credentials if cred.id in retained_ids]
         system.credentials.extend(new_credentials)
-        scopes = {cred.access_scope for cred in system.credentials}
-        if ModelAccessType.GUI in scopes and ModelAccessType.CLI in scopes:
-            system.access_type = ModelAccessType.BOTH
-        elif ModelAccessType.GUI in scopes:
-            system.access_type = ModelAccessType.GUI
-        elif ModelAccessType.CLI in scopes:
-            system.access_type = ModelAccessType.CLI
-        else:
-            system.access_type = ModelAccessType.GUI
+        system.access_type = _derive_access_type(system.credentials)
     await db.commit()
-    stmt = select(System).options(selectinload(System.credentials)).where(System.id == system.id)
-    result = await db.execute(stmt)
-    return result.scalar_one()
+    return system
 
 
 @router.delete("/{system_id}", status_code=status.HTTP_204_NO_CONTENT)
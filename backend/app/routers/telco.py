@@ -23,8 +23,7 @@ router = APIRouter(prefix="/telco", tags=["telco"])
 
 
 async def _get_job_or_404(db: AsyncSession, job_id: UUID) -> TelcoFabricOnboardingJob:
-    result = await db.execute(select(TelcoFabricOnboardingJob).where(TelcoFabricOnboardingJob.id == job_id))
-    job = result.scalar_one_or_none()
+    job = await db.get(TelcoFabricOnboardingJob, job_id)
     if job is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Onboarding job not found")
     return job
@@ -74,7 +73,6 @@ async def create_onboarding_job(
             job.last_snapshot = None
 
     await db.commit()
-    await db.refresh(job)
     return TelcoOnboardingJobRead.model_validate(job)
 
 
@@ -84,10 +82,7 @@ async def get_onboarding_job(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),  # noqa: B008
 ) -> TelcoOnboardingJobRead:
-    result = await db.execute(select(TelcoFabricOnboardingJob).where(TelcoFabricOnboardingJob.id == job_id))
-    job = result.scalar_one_or_none()
-    if job is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Onboarding job not found")
+    job = await _get_job_or_404(db, job_id)
     return TelcoOnboardingJobRead.model_validate(job)
 
 
@@ -98,10 +93,7 @@ async def validate_onboarding_job(
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_admin),
 ) -> TelcoOnboardingJobRead:
-    result = await db.execute(select(TelcoFabricOnboardingJob).where(TelcoFabricOnboardingJob.id == job_id))
-    job = result.scalar_one_or_none()
-    if job is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Onboarding job not found")
+    job = await _get_job_or_404(db, job_id)
     password_override = payload.password
     if payload.password:
         job.password_secret = encrypt_secret(payload.password)
@@ -119,7 +111,6 @@ async def validate_onboarding_job(
             job.mark_validation_failure(collection_result.message or payload.error_message)
             job.last_snapshot = None
     await db.commit()
-    await db.refresh(job)
     return TelcoOnboardingJobRead.model_validate(job)
 
 
@@ -157,7 +148,6 @@ async def update_onboarding_job(
         job.password_secret = encrypt_secret(password)
 
     await db.commit()
-    await db.refresh(job)
     return TelcoOnboardingJobRead.model_validate(job)
 
 
@@ -191,7 +181,6 @@ async def sync_onboarding_job(
         job.mark_validation_failure(result.message)
         job.last_snapshot = None
         await db.commit()
-        await db.refresh(job)
         return TelcoSyncResult(
             success=False,
             message=result.message or "Inventory collection failed.",
@@ -217,7 +206,6 @@ async def sync_onboarding_job(
             pbr_note = f" PBR refresh failed: {pbr_result.message}."
 
     await db.commit()
-    await db.refresh(job)
 
     return TelcoSyncResult(
         success=True,
@@ -234,9 +222,6 @@ async def delete_onboarding_job(
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_admin),
 ) -> None:
-    result = await db.execute(select(TelcoFabricOnboardingJob).where(TelcoFabricOnboardingJob.id == job_id))
-    job = result.scalar_one_or_none()
-    if job is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Onboarding job not found")
+    job = await _get_job_or_404(db, job_id)
     await db.delete(job)
     await db.commit()
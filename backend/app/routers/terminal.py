@@ -2,28 +2,30 @@ import asyncio
 from typing import Optional
 from uuid import UUID
 
+import jwt
 from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
-from jose import JWTError, jwt
 from sqlalchemy.orm import selectinload
 
-from app.core.config import get_settings
-from app.core.database import AsyncSessionLocal
-from app.models import System
+from app.core.database import AsyncSessionLocal, strict_loading
+from app.dependencies import decode_token_subject
+from app.models import System, SystemCredential
 from app.models.system import AccessType as ModelAccessType
 from app.services.ssh import ssh_connection
 
 router = APIRouter(prefix="/terminal", tags=["terminal"])
-settings = get_settings()
+
+# read() returns whatever output is already buffered, up to this size, so bulk output
+# (cat, show tech) goes out as a few large frames instead of many small ones.
+TERMINAL_READ_CHUNK = 32 * 1024
 
 
 async def _authenticate_websocket(token: str) -> UUID:
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        subject = payload.get("sub")
+        subject = decode_token_subject(token)
         if subject is None:
             raise ValueError("Missing subject")
         return UUID(subject)
-    except (JWTError, ValueError) as exc:  # noqa: F841
+    except (jwt.PyJWTError, ValueError) as exc:  # noqa: F841
         raise HTTPException(status_code=403, detail="Invalid token") from exc
 
 
@@ -39,19 +41,16 @@ async def terminal_websocket(websocket: WebSocket, system_id: UUID, token: Optio
         return
     await websocket.accept()
     async with AsyncSessionLocal() as session:
-        system = await session.get(System, system_id, options=[selectinload(System.credentials)])
+        # Only CLI-capable credentials are loaded; GUI-only secrets never leave the database.
+        cli_credentials = System.credentials.and_(
+            SystemCredential.access_scope.in_((ModelAccessType.CLI, ModelAccessType.BOTH))
+        )
+        system = await session.get(System, system_id, options=[selectinload(cli_credentials), *strict_loading()])
         if system is None:
             await websocket.send_text("System not found")
             await websocket.close(code=4404)
             return
-        credential = next(
-            (
-                cred
-                for cred in system.credentials
-                if cred.access_scope in {ModelAccessType.CLI, ModelAccessType.BOTH}
-            ),
-            None,
-        )
+        credential = system.credentials[0] if system.credentials else None
         if credential is None:
             await websocket.send_text("CLI credential not configured")
             await websocket.close(code=4403)
@@ -61,23 +60,32 @@ async def terminal_websocket(websocket: WebSocket, system_id: UUID, token: Optio
             host=host,
             username=credential.user_id,
             secret=credential.credential_secret,
-        ) as channel:
+        ) as process:
             try:
                 async def read_from_channel():
                     while True:
-                        if channel.recv_ready():
-                            data = await asyncio.get_event_loop().run_in_executor(None, channel.recv, 1024)
-                            if not data:
-                                break
-                            await websocket.send_text(data.decode("utf-8", errors="ignore"))
-                        await asyncio.sleep(0.05)
+                        data = await process.stdout.read(TERMINAL_READ_CHUNK)
+                        if not data:
+                            break
+                        await websocket.send_bytes(data)
 
                 async def write_to_channel():
                     while True:
                         message = await websocket.receive_text()
-                        await asyncio.get_event_loop().run_in_executor(None, channel.send, message)
+                        process.stdin.write(message.encode())
+                        await process.stdin.drain()
 
-                await asyncio.gather(read_from_channel(), write_to_channel())
+                # Whichever side ends first (shell exit or browser disconnect) ends the
+                # session; gather() would leave the other side waiting forever.
+                done, pending = await asyncio.wait(
+                    {asyncio.create_task(read_from_channel()), asyncio.create_task(write_to_channel())},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                for task in done:
+                    task.result()
             except WebSocketDisconnect:
                 pass
             finally:
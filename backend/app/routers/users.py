@@ -1,8 +1,9 @@
+import asyncio
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_password_hash
@@ -12,12 +13,22 @@ from app.schemas.user import UserRead, UserUpdate
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+STREAM_BATCH = 256
+
 
 @router.get("/", response_model=List[UserRead])
-async def list_users(db: AsyncSession = Depends(get_db), _: User = Depends(require_admin)):
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+async def list_users(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    stmt = select(User).order_by(User.email).limit(limit).offset(offset)
+    # Validate rows as they stream in rather than materializing the ORM list first.
+    result = await db.stream_scalars(stmt, execution_options={"yield_per": STREAM_BATCH})
+    return [UserRead.model_validate(user) async for user in result]
 
 
 @router.get("/{user_id}", response_model=UserRead)
@@ -30,26 +41,36 @@ async def get_user(user_id: UUID, db: AsyncSession = Depends(get_db), _: User =
 
 @router.patch("/{user_id}", response_model=UserRead)
 async def update_user(user_id: UUID, payload: UserUpdate, db: AsyncSession = Depends(get_db), _: User = Depends(require_admin)):
-    user = await db.get(User, user_id)
+    # Every updatable column is NOT NULL, so an explicit null leaves the field as is.
+    values = payload.model_dump(exclude_unset=True, exclude_none=True)
+    # A blank password means "unchanged", as it always has for this endpoint.
+    password = values.pop("password", None)
+    if password:
+        values["hashed_password"] = await asyncio.to_thread(get_password_hash, password)
+    if "role" in values:
+        values["role"] = UserRoleEnum(values["role"].value)
+    if values:
+        result = await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User)
+            # The acting admin may be this same row, already loaded by require_admin.
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        user = result.scalar_one_or_none()
+    else:
+        user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    updates = payload.model_dump(exclude_unset=True)
-    if "password" in updates and updates["password"]:
-        user.hashed_password = get_password_hash(updates.pop("password"))
-    if "role" in updates and updates["role"]:
-        user.role = UserRoleEnum(updates.pop("role").value)
-    for field, value in updates.items():
-        setattr(user, field, value)
     await db.commit()
-    await db.refresh(user)
     return user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: UUID, db: AsyncSession = Depends(get_db), _: User = Depends(require_admin)):
-    user = await db.get(User, user_id)
-    if user is None:
+    result = await db.execute(delete(User).where(User.id == user_id).returning(User.id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    await db.delete(user)
     await db.commit()
     return None
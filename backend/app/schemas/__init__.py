@@ -12,6 +12,7 @@ from .inventory import (
     InventoryVMRead,
     InventoryEndpointValidationResult,
     InventoryEndpointSyncResponse,
+    InventorySyncJobRead,
 )
 from .aci import (
     AciFabricEndpointPage,
@@ -132,6 +133,7 @@ __all__ = [
     "InventoryVMRead",
     "InventoryEndpointValidationResult",
     "InventoryEndpointSyncResponse",
+    "InventorySyncJobRead",
     "AciFabricEndpointRead",
     "AciFabricEndpointPage",
     "AciFabricVlanRead",
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.cgnat import CgnatDeviceStatus, CgnatVendor
 
@@ -87,8 +87,7 @@ class CgnatDeviceRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CgnatInterfaceRead(BaseModel):
@@ -107,8 +106,7 @@ class CgnatInterfaceRead(BaseModel):
     mtu: Optional[int] = None
     mac: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CgnatNatPoolRead(BaseModel):
@@ -130,8 +128,7 @@ class CgnatNatPoolRead(BaseModel):
     translation_failures: Optional[int] = None
     port_util_pct: Optional[float] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CgnatStaticRouteRead(BaseModel):
@@ -148,8 +145,7 @@ class CgnatStaticRouteRead(BaseModel):
     family: Optional[str] = None
     description: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CgnatDevicePage(BaseModel):
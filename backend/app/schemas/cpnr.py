@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.cpnr import CpnrPairStatus, CpnrRole, CpnrStatus
 
@@ -72,8 +72,7 @@ class CpnrVmRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CpnrVmPage(BaseModel):
@@ -93,8 +92,7 @@ class CpnrObjectRead(BaseModel):
     data: Dict[str, Any]
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CpnrChangeEventRead(BaseModel):
@@ -105,8 +103,7 @@ class CpnrChangeEventRead(BaseModel):
     action: str
     changes: Optional[List[Dict[str, Any]]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CpnrConnectivityResult(BaseModel):
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .system import SystemRead
 
@@ -23,8 +23,7 @@ class GroupUpdate(BaseModel):
 class GroupRead(GroupBase):
     id: UUID
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GroupDetail(GroupRead):
@@ -2,13 +2,14 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.inventory import (
     InventoryEndpointStatus,
     InventoryEndpointType,
     InventoryHostConnectionState,
     InventoryPowerState,
+    InventorySyncJobStatus,
 )
 
 
@@ -42,7 +43,7 @@ class InventoryEndpointUpdate(BaseModel):
 
 
 class InventoryEndpointRead(BaseModel):
-    id: str
+    id: UUID
     name: str
     address: str
     port: int
@@ -59,13 +60,12 @@ class InventoryEndpointRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryHostRead(BaseModel):
-    id: str
-    endpoint_id: str
+    id: UUID
+    endpoint_id: UUID
     endpoint_name: str
     name: str
     serial: Optional[str]
@@ -90,8 +90,7 @@ class InventoryHostRead(BaseModel):
     last_seen_at: Optional[datetime]
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryTopologyNode(BaseModel):
@@ -123,15 +122,14 @@ class InventoryHostNicRead(BaseModel):
     remote_platform: Optional[str] = None
     remote_mgmt: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryVMRead(BaseModel):
-    id: str
-    endpoint_id: str
+    id: UUID
+    endpoint_id: UUID
     endpoint_name: str
-    host_id: Optional[str]
+    host_id: Optional[UUID]
     host_name: Optional[str]
     name: str
     guest_os: Optional[str]
@@ -150,13 +148,12 @@ class InventoryVMRead(BaseModel):
     last_seen_at: Optional[datetime]
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryDatastoreRead(BaseModel):
-    id: str
-    endpoint_id: str
+    id: UUID
+    endpoint_id: UUID
     endpoint_name: str
     name: str
     type: Optional[str]
@@ -165,20 +162,18 @@ class InventoryDatastoreRead(BaseModel):
     last_seen_at: Optional[datetime]
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryNetworkRead(BaseModel):
-    id: str
-    endpoint_id: str
+    id: UUID
+    endpoint_id: UUID
     endpoint_name: str
     name: str
     last_seen_at: Optional[datetime]
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryEndpointValidationResult(BaseModel):
@@ -193,4 +188,17 @@ class InventoryEndpointValidationResult(BaseModel):
 
 class InventoryEndpointSyncResponse(BaseModel):
     endpoint: InventoryEndpointRead
-    summary: InventoryEndpointValidationResult
\ No newline at end of file
+    summary: InventoryEndpointValidationResult
+
+
+class InventorySyncJobRead(BaseModel):
+    id: UUID
+    endpoint_id: UUID
+    status: InventorySyncJobStatus
+    summary: Optional[InventoryEndpointValidationResult]
+    error_message: Optional[str]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
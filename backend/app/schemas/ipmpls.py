@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.ipmpls import IpMplsDeviceStatus, IpMplsPlatform
 
@@ -71,8 +71,7 @@ class IpMplsDeviceRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IpMplsInterfaceRead(BaseModel):
@@ -92,8 +91,7 @@ class IpMplsInterfaceRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IpMplsModuleRead(BaseModel):
@@ -105,8 +103,7 @@ class IpMplsModuleRead(BaseModel):
     vid: Optional[str] = None
     serial: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IpMplsVrfRead(BaseModel):
@@ -120,8 +117,7 @@ class IpMplsVrfRead(BaseModel):
     protocols: Optional[str] = None
     description: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IpMplsNeighborRead(BaseModel):
@@ -136,8 +132,7 @@ class IpMplsNeighborRead(BaseModel):
     vrf: Optional[str] = None
     attributes: dict = Field(default_factory=dict)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IpMplsDevicePage(BaseModel):
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.nxos import NxosDeviceStatus, NxosPlatform
 
@@ -71,8 +71,7 @@ class NxosDeviceRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NxosInterfaceRead(BaseModel):
@@ -95,8 +94,7 @@ class NxosInterfaceRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NxosModuleRead(BaseModel):
@@ -109,8 +107,7 @@ class NxosModuleRead(BaseModel):
     serial: Optional[str] = None
     slot: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NxosVrfRead(BaseModel):
@@ -122,8 +119,7 @@ class NxosVrfRead(BaseModel):
     interfaces: List[str] = Field(default_factory=list)
     attributes: dict = Field(default_factory=dict)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NxosNeighborRead(BaseModel):
@@ -137,8 +133,7 @@ class NxosNeighborRead(BaseModel):
     remote_mgmt_ip: Optional[str] = None
     attributes: dict = Field(default_factory=dict)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NxosBgpNeighborRead(BaseModel):
@@ -156,8 +151,7 @@ class NxosBgpNeighborRead(BaseModel):
     description: Optional[str] = None
     attributes: dict = Field(default_factory=dict)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NxosDevicePage(BaseModel):
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.pbr import PbrLayer, PbrNodeStatus, PbrServiceState, PbrThresholdAction
 
@@ -18,8 +18,7 @@ class PbrRedirectDestRead(BaseModel):
     resolved: bool
     learned: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PbrNodeRead(BaseModel):
@@ -52,8 +51,7 @@ class PbrNodeRead(BaseModel):
     detail: Dict[str, Any] = Field(default_factory=dict)
     redirect_dests: List[PbrRedirectDestRead] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PbrServiceRead(BaseModel):
@@ -72,8 +70,7 @@ class PbrServiceRead(BaseModel):
     stale_as_of: Optional[datetime]
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PbrServiceDetail(PbrServiceRead):
@@ -124,8 +121,7 @@ class PbrHealthSampleRead(BaseModel):
     health_pct: Optional[float]
     state: PbrServiceState
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PbrHealthHistory(BaseModel):
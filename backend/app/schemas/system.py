@@ -2,7 +2,7 @@ from enum import Enum
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class AccessType(str, Enum):
@@ -35,8 +35,7 @@ class SystemCredentialUpdate(SystemCredentialBase):
 class SystemCredentialRead(SystemCredentialBase):
     id: UUID
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SystemCredentialSecret(SystemCredentialRead):
@@ -69,5 +68,4 @@ class SystemRead(SystemBase):
     group_id: UUID
     credentials: List[SystemCredentialRead] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -22,6 +22,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import csv
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence
@@ -271,10 +272,9 @@ def print_results(results: Sequence[VerificationResult]) -> None:
     def _format_line(values: Sequence[str]) -> str:
         return " | ".join(value.ljust(column_widths[idx]) for idx, value in enumerate(values))
 
-    print(_format_line(headers))
-    print("-+-".join("-" * width for width in column_widths))
-    for row in rows:
-        print(_format_line(row))
+    lines = [_format_line(headers), "-+-".join("-" * width for width in column_widths)]
+    lines.extend(_format_line(row) for row in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
 
     total = len(results)
     matched = sum(1 for item in results if item.status == STATUS_MATCH)
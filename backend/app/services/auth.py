@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 
 from sqlalchemy import select
@@ -12,6 +13,8 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> Opti
     user = result.scalar_one_or_none()
     if user is None:
         return None
-    if not verify_password(password, user.hashed_password):
+    # bcrypt is deliberately slow (~tens of ms) and releases the GIL; run it on a
+    # worker thread so a login does not stall every other request on the loop.
+    if not await asyncio.to_thread(verify_password, password, user.hashed_password):
         return None
     return user
@@ -1,3 +1,4 @@
+from cachetools import TTLCache
 from cryptography.fernet import Fernet
 
 from app.core.config import get_settings
@@ -5,6 +6,10 @@ from app.core.config import get_settings
 _settings = get_settings()
 _fernet = Fernet(_settings.fernet_key)
 
+# Ciphertext -> plaintext for secrets that are decrypted on every poll or connectivity
+# test. Keyed by the token itself, so a rotated password simply becomes a new entry.
+_decrypt_cache: "TTLCache[bytes, str]" = TTLCache(maxsize=2048, ttl=300)
+
 
 def encrypt_secret(secret: str) -> bytes:
     return _fernet.encrypt(secret.encode("utf-8"))
@@ -12,3 +17,17 @@ def encrypt_secret(secret: str) -> bytes:
 
 def decrypt_secret(token: bytes) -> str:
     return _fernet.decrypt(token).decode("utf-8")
+
+
+def decrypt_secret_cached(token: bytes) -> str:
+    secret = _decrypt_cache.get(token)
+    if secret is None:
+        secret = _decrypt_cache[token] = decrypt_secret(token)
+    return secret
+
+
+def forget_secret(token: bytes | None) -> None:
+    """Drop a cached plaintext, e.g. when its ciphertext is rotated out."""
+
+    if token is not None:
+        _decrypt_cache.pop(token, None)
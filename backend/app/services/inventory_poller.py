@@ -21,8 +21,8 @@ from app.models import (
 	InventoryPowerState,
 	InventoryVirtualMachine,
 )
-from app.services.crypto import decrypt_secret
-from app.services.vsphere import VsphereSnapshot, collect_inventory
+from app.services.crypto import decrypt_secret_cached
+from app.services.vsphere import VsphereSnapshot, collect_inventory_async
 from app.core.config import get_settings
 from app.services.nautobot import fetch_nautobot_device_locations, compute_device_location
 
@@ -228,8 +228,14 @@ async def _upsert_virtual_machines(
 		vm.provisioned_storage_gb = vm_data.provisioned_storage_gb
 		vm.used_storage_gb = vm_data.used_storage_gb
 		vm.ip_address = vm_data.ip_address
-		vm.datastores = sorted({name.strip() for name in vm_data.datastores if name})
-		vm.networks = sorted({name.strip() for name in vm_data.networks if name})
+		# Only touch the JSON columns when their content changed, so steady-state
+		# polls don't mark them dirty and re-serialize them on flush.
+		datastores = sorted({name.strip() for name in vm_data.datastores if name})
+		if vm.datastores != datastores:
+			vm.datastores = datastores
+		networks = sorted({name.strip() for name in vm_data.networks if name})
+		if vm.networks != networks:
+			vm.networks = networks
 		vm.tools_status = vm_data.tools_status
 		vm.is_template = vm_data.is_template
 		vm.last_seen_at = snapshot.collected_at
@@ -259,11 +265,10 @@ async def run_poll_for_endpoint(
 	endpoint: InventoryEndpoint,
 ) -> PollResult:
 	started = datetime.now(timezone.utc)
-	password = decrypt_secret(endpoint.password_secret)
+	password = decrypt_secret_cached(endpoint.password_secret)
 
 	try:
-		snapshot = await asyncio.to_thread(
-			collect_inventory,
+		snapshot = await collect_inventory_async(
 			endpoint.address,
 			endpoint.port,
 			endpoint.username,
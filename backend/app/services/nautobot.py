@@ -1,15 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import httpx
 
+try:  # orjson parses the large paginated payloads several times faster than stdlib json.
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 DeviceLocation = Tuple[Optional[str], Optional[str]]
 
+# Keep-alive pool shared by every request a client issues, so paginated device
+# fetches reuse sockets instead of paying a TCP/TLS handshake per page.
+_POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+_TRANSPORT_RETRIES = 3
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_BACKOFF = 0.2
+# Concurrent page fetches per listing; must stay <= the pool size above.
+_PAGE_WORKERS = 8
+# Names per filtered device query; keeps the query string well under URL limits.
+_NAME_FILTER_BATCH = 50
+
 
 @dataclass
 class NautobotLocationIndex:
@@ -104,6 +121,77 @@ def compute_device_facts(device: Dict[str, object]) -> NautobotDeviceFacts:
     )
 
 
+def _build_client(base_url: str, token: str, timeout: float) -> httpx.AsyncClient:
+    """Return an AsyncClient with a keep-alive pool and connect retries."""
+    headers = {
+        "Accept": "application/json",
+        "Authorization": f"Token {token}",
+        "User-Agent": "NetVerse-Collector/1.0",
+        "Connection": "keep-alive",
+    }
+    transport = httpx.AsyncHTTPTransport(limits=_POOL_LIMITS, retries=_TRANSPORT_RETRIES)
+    return httpx.AsyncClient(
+        base_url=base_url.rstrip("/"),
+        headers=headers,
+        timeout=httpx.Timeout(timeout, read=timeout),
+        transport=transport,
+    )
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+) -> httpx.Response:
+    """GET a Nautobot endpoint, retrying transient gateway errors (502/503/504) with backoff."""
+    response = await client.get(url, params=params)
+    for attempt in range(_TRANSPORT_RETRIES):
+        if response.status_code not in _RETRY_STATUSES:
+            break
+        await asyncio.sleep(_RETRY_BACKOFF * (2 ** attempt))
+        response = await client.get(url, params=params)
+    response.raise_for_status()
+    return response
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def _paginate_concurrent(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Mapping[str, Any],
+    *,
+    page_size: int,
+    workers: int,
+) -> List[List[Any]]:
+    """Fetch every page of a Nautobot list endpoint, overlapping page round-trips.
+
+    The first page reports the total ``count``; the remaining pages are then
+    requested concurrently by ``offset`` (bounded by ``workers``) instead of
+    walking the ``next`` links one round-trip at a time. Pages are returned in
+    offset order.
+    """
+    first = _decode_json(await _get_with_retry(client, url, {**params, "limit": str(page_size), "offset": "0"}))
+    pages: List[List[Any]] = [first.get("results", [])]
+    count = first.get("count") or 0
+    if count <= page_size:
+        return pages
+
+    semaphore = asyncio.Semaphore(max(1, workers))
+
+    async def _fetch(offset: int) -> List[Any]:
+        async with semaphore:
+            response = await _get_with_retry(client, url, {**params, "limit": str(page_size), "offset": str(offset)})
+            return _decode_json(response).get("results", [])
+
+    pages.extend(await asyncio.gather(*(_fetch(offset) for offset in range(page_size, count, page_size))))
+    return pages
+
+
 async def fetch_nautobot_device_facts_by_name(
     base_url: str,
     token: str,
@@ -114,16 +202,9 @@ async def fetch_nautobot_device_facts_by_name(
     """Look up a single device by exact name and return its role/site/rack."""
     if not name:
         return None
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Token {token}",
-        "User-Agent": "NetVerse-Collector/1.0",
-    }
-    timeout_config = httpx.Timeout(timeout, read=timeout)
-    async with httpx.AsyncClient(base_url=base_url.rstrip("/"), headers=headers, timeout=timeout_config) as client:
-        response = await client.get("/dcim/devices/", params={"name": name, "limit": "1"})
-        response.raise_for_status()
-        results = response.json().get("results", [])
+    async with _build_client(base_url, token, timeout) as client:
+        response = await _get_with_retry(client, "/dcim/devices/", {"name": name, "limit": "1"})
+        results = _decode_json(response).get("results", [])
         if not results or not isinstance(results[0], dict):
             return None
         return compute_device_facts(results[0])
@@ -135,38 +216,43 @@ async def fetch_nautobot_device_locations(
     *,
     timeout: float = 30.0,
     page_size: int = 100,
+    workers: int = _PAGE_WORKERS,
+    names: Optional[Iterable[str]] = None,
 ) -> NautobotLocationIndex:
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Token {token}",
-        "User-Agent": "NetVerse-Collector/1.0",
-    }
+    """Build a name -> (site, rack_location) index of Nautobot devices.
+
+    When ``names`` is given, only those devices are requested (case-insensitive
+    ``name__ie`` filter, batched) instead of downloading the whole device table.
+    """
     exact: Dict[str, DeviceLocation] = {}
     lower: Dict[str, DeviceLocation] = {}
 
-    timeout_config = httpx.Timeout(timeout, read=timeout)
-    async with httpx.AsyncClient(base_url=base_url.rstrip("/"), headers=headers, timeout=timeout_config) as client:
-        next_url: Optional[str] = "/dcim/devices/"
-        params = {"limit": str(page_size)}
-
-        while next_url:
-            url = next_url
-            request_params = params if next_url == "/dcim/devices/" else None
-            response = await client.get(url, params=request_params)
-            response.raise_for_status()
-            payload = response.json()
-
-            for device in payload.get("results", []):
-                if not isinstance(device, dict):
-                    continue
-                name = device.get("name") or device.get("display")
-                if not isinstance(name, str) or not name.strip():
-                    continue
-                record = compute_device_location(device)
-                exact[name] = record
-                lower[name.lower()] = record
-
-            next_url = payload.get("next")
+    if names is None:
+        filters: List[Dict[str, Any]] = [{}]
+    else:
+        wanted = sorted({name for name in names if name})
+        filters = [
+            {"name__ie": wanted[start:start + _NAME_FILTER_BATCH]}
+            for start in range(0, len(wanted), _NAME_FILTER_BATCH)
+        ]
+
+    pages: List[List[Any]] = []
+    async with _build_client(base_url, token, timeout) as client:
+        for params in filters:
+            pages.extend(
+                await _paginate_concurrent(client, "/dcim/devices/", params, page_size=page_size, workers=workers)
+            )
+
+    for results in pages:
+        for device in results:
+            if not isinstance(device, dict):
+                continue
+            name = device.get("name") or device.get("display")
+            if not isinstance(name, str) or not name.strip():
+                continue
+            record = compute_device_location(device)
+            exact[name] = record
+            lower[name.lower()] = record
 
     logger.debug(
         "Fetched %d Nautobot device location entries", len(exact)
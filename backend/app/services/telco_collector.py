@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Tuple
 
 import httpx
-from sqlalchemy import delete, select, text
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import get_settings
@@ -491,7 +491,6 @@ async def _collect_aci_fabric(
         payload = fabric_response.json()
 
         items = payload.get("imdata", [])
-        await _ensure_aci_node_location_columns(session)
         count = await _upsert_aci_nodes(session, items, job)
         await session.flush()
 
@@ -523,8 +522,13 @@ async def _enrich_nodes_with_nautobot(session: AsyncSession, nodes: Iterable[Aci
     if not base_url or not token:
         return 0
 
+    nodes = list(nodes)
+    names = [node.name for node in nodes if node.name]
+    if not names:
+        return 0
+
     try:
-        location_index = await fetch_nautobot_device_locations(base_url, token)
+        location_index = await fetch_nautobot_device_locations(base_url, token, names=names)
     except httpx.HTTPError as exc:
         logger.warning("Failed to enrich ACI nodes from Nautobot: %s", exc)
         return 0
@@ -551,40 +555,6 @@ async def _enrich_nodes_with_nautobot(session: AsyncSession, nodes: Iterable[Aci
     return updated
 
 
-async def _ensure_aci_node_location_columns(session: AsyncSession) -> None:
-    bind = session.get_bind()
-    if bind is None:
-        return
-
-    dialect = bind.dialect.name
-    statements: List[str] = []
-
-    if dialect == "sqlite":
-        result = await session.execute(text("PRAGMA table_info('aci_fabric_nodes')"))
-        existing_columns = {row[1] for row in result.all() if len(row) > 1}
-        if "site_name" not in existing_columns:
-            statements.append("ALTER TABLE aci_fabric_nodes ADD COLUMN site_name VARCHAR")
-        if "rack_location" not in existing_columns:
-            statements.append("ALTER TABLE aci_fabric_nodes ADD COLUMN rack_location VARCHAR")
-    else:
-        statements = [
-            "ALTER TABLE aci_fabric_nodes ADD COLUMN IF NOT EXISTS site_name VARCHAR",
-            "ALTER TABLE aci_fabric_nodes ADD COLUMN IF NOT EXISTS rack_location VARCHAR",
-        ]
-
-    for ddl in statements:
-        try:
-            await session.execute(text(ddl))
-        except Exception as exc:
-            message = str(exc).lower()
-            if "duplicate" in message or "exists" in message:
-                continue
-            raise
-
-    if statements:
-        await session.commit()
-
-
 async def _collect_nxos_fabric(
     job: TelcoFabricOnboardingJob,
     password: str,
@@ -723,6 +693,13 @@ async def _upsert_aci_nodes(
     items: Iterable[Dict[str, Any]],
     job: TelcoFabricOnboardingJob,
 ) -> int:
+    # One SELECT for the whole fabric instead of one per node; the flush then batches
+    # the INSERTs and only UPDATEs nodes whose attributes actually changed.
+    existing = (
+        await session.execute(select(AciFabricNode).where(AciFabricNode.fabric_job_id == job.id))
+    ).scalars().all()
+    nodes_by_dn: Dict[str, AciFabricNode] = {node.distinguished_name: node for node in existing}
+
     total = 0
     seen_dns: set[str] = set()
     for item in items:
@@ -733,13 +710,7 @@ async def _upsert_aci_nodes(
         if not dn:
             continue
         seen_dns.add(dn)
-        result = await session.execute(
-            select(AciFabricNode).where(
-                AciFabricNode.distinguished_name == dn,
-                AciFabricNode.fabric_job_id == job.id,
-            )
-        )
-        node = result.scalar_one_or_none()
+        node = nodes_by_dn.get(dn)
         if node is None:
             node = AciFabricNode(
                 distinguished_name=dn,
@@ -748,8 +719,7 @@ async def _upsert_aci_nodes(
                 fabric_job_id=job.id,
             )
             session.add(node)
-        else:
-            node.fabric_job_id = job.id
+            nodes_by_dn[dn] = node
         node.update_from_attributes(attributes)
         total += 1
 
@@ -758,12 +728,7 @@ async def _upsert_aci_nodes(
     # failed fabricNode response can never wipe the fabric's inventory. Children are removed
     # explicitly (interfaces + detail) rather than relying on SQLite FK cascade.
     if seen_dns:
-        existing_nodes = (
-            await session.execute(
-                select(AciFabricNode).where(AciFabricNode.fabric_job_id == job.id)
-            )
-        ).scalars().all()
-        stale_ids = [node.id for node in existing_nodes if node.distinguished_name not in seen_dns]
+        stale_ids = [node.id for node in existing if node.distinguished_name not in seen_dns]
         if stale_ids:
             await session.execute(
                 delete(AciFabricNodeInterface).where(AciFabricNodeInterface.node_id.in_(stale_ids))
@@ -1,7 +1,15 @@
+import asyncio
+import hashlib
+import multiprocessing
+import multiprocessing.util
+import os
 import ssl
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from pyVim.connect import Disconnect, SmartConnect
 
@@ -243,6 +251,191 @@ def _iter_vm_entities(folder):
             yield entity
 
 
+def _collect_snapshot(si, address: str) -> VsphereSnapshot:
+    content = si.RetrieveContent()
+    # apiType is "HostAgent" for a direct ESXi connection, "VirtualCenter" for vCenter.
+    # A direct ESXi host often reports config.name as "localhost.localdomain"; fall back to
+    # the address we connected to (the host's IP) so the UI shows a meaningful identifier.
+    api_type = getattr(getattr(content, "about", None), "apiType", None)
+    is_direct_esxi = api_type == "HostAgent"
+
+    def _resolve_host_name(config_name: Optional[str]) -> str:
+        if is_direct_esxi and (not config_name or str(config_name).strip().lower() in ("localhost.localdomain", "localhost")):
+            return address
+        return config_name or address
+
+    hosts: List[VsphereHost] = []
+    virtual_machines: List[VsphereVirtualMachine] = []
+    datastore_map: dict[str, VsphereDatastore] = {}
+    network_names: Set[str] = set()
+
+    for datacenter in _iter_datacenters(content.rootFolder):
+        host_folder = getattr(datacenter, "hostFolder", None)
+        if host_folder is None:
+            continue
+        for compute_resource in host_folder.childEntity:
+            cluster_name = getattr(compute_resource, "name", None)
+            for esxi_host in getattr(compute_resource, "host", []) or []:
+                summary = esxi_host.summary
+                hardware = summary.hardware
+                quickstats = summary.quickStats
+                total_bytes = 0
+                free_bytes = 0
+                for datastore in getattr(esxi_host, "datastore", []) or []:
+                    ds_summary = datastore.summary
+                    total_bytes += ds_summary.capacity or 0
+                    free_bytes += ds_summary.freeSpace or 0
+
+                # Determine serial number with fallbacks (systemInfo, summary.otherIdentifyingInfo)
+                serial_val = getattr(getattr(hardware, "systemInfo", None), "serialNumber", None)
+                if not serial_val:
+                    # otherIdentifyingInfo can contain vendor-specific identifier tuples
+                    other = getattr(summary.hardware, "otherIdentifyingInfo", None)
+                    if other:
+                        for info in other:
+                            # identifierType may expose label or key that indicates serial/service tag
+                            id_type = getattr(info, "identifierType", None)
+                            label = getattr(id_type, "label", None) or getattr(id_type, "key", None) or ""
+                            if "serial" in str(label).lower() or "service" in str(label).lower():
+                                serial_val = getattr(info, "identifierValue", None)
+                                break
+
+                host_config = getattr(esxi_host, "config", None)
+                host_net = getattr(host_config, "network", None) if host_config else None
+                nics, mgmt_ip = _host_nics_and_mgmt(esxi_host, host_net)
+                portgroups = _host_portgroups(host_net)
+
+                hosts.append(
+                    VsphereHost(
+                        name=_resolve_host_name(getattr(summary.config, "name", None)),
+                        cluster=cluster_name,
+                        hardware_model=getattr(hardware, "model", None),
+                        serial=serial_val,
+                        connection_state=str(summary.runtime.connectionState) if summary.runtime else "unknown",
+                        power_state=str(summary.runtime.powerState) if summary.runtime else "unknown",
+                        cpu_cores=getattr(hardware, "numCpuCores", None),
+                        cpu_usage_mhz=getattr(quickstats, "overallCpuUsage", None),
+                        memory_total_mb=(getattr(hardware, "memorySize", None) or 0) // (1024 * 1024)
+                        if getattr(hardware, "memorySize", None)
+                        else None,
+                        memory_usage_mb=getattr(quickstats, "overallMemoryUsage", None),
+                        uptime_seconds=getattr(quickstats, "uptime", None),
+                        datastore_total_gb=_bytes_to_gb(total_bytes),
+                        datastore_free_gb=_bytes_to_gb(free_bytes),
+                        vendor=getattr(hardware, "vendor", None),
+                        cpu_model=getattr(hardware, "cpuModel", None),
+                        bios_version=getattr(getattr(hardware, "biosInfo", None), "biosVersion", None),
+                        esxi_version=getattr(getattr(host_config, "product", None), "fullName", None) if host_config else None,
+                        management_ip=mgmt_ip,
+                        nics=nics,
+                        portgroups=portgroups,
+                    )
+                )
+
+        vm_folder = getattr(datacenter, "vmFolder", None)
+        if vm_folder is None:
+            continue
+        for entity in _iter_vm_entities(vm_folder):
+            summary = entity.summary
+            quickstats = summary.quickStats
+            storage = getattr(summary, "storage", None)
+            runtime = summary.runtime
+            host_ref = getattr(runtime, "host", None) if runtime else None
+            guest = summary.guest
+
+            vm_datastores = [ds.name for ds in getattr(entity, "datastore", []) or []]
+            vm_networks = [net.name for net in getattr(entity, "network", []) or []]
+
+            virtual_machines.append(
+                VsphereVirtualMachine(
+                    name=summary.config.name,
+                    host_name=_resolve_host_name(host_ref.name) if host_ref else None,
+                    guest_os=summary.config.guestFullName if summary.config else None,
+                    power_state=str(runtime.powerState) if runtime else "unknown",
+                    ip_address=guest.ipAddress if guest else None,
+                    cpu_count=summary.config.numCpu if summary.config else None,
+                    memory_mb=summary.config.memorySizeMB if summary.config else None,
+                    cpu_usage_mhz=getattr(quickstats, "overallCpuUsage", None),
+                    memory_usage_mb=getattr(quickstats, "guestMemoryUsage", None),
+                    used_storage_gb=_bytes_to_gb(getattr(storage, "committed", None) if storage else None),
+                    provisioned_storage_gb=_bytes_to_gb(getattr(quickstats, "committedStorage", None)),
+                    datastores=vm_datastores,
+                    networks=vm_networks,
+                    tools_status=guest.toolsRunningStatus if guest else None,
+                    is_template=bool(getattr(summary.config, "template", False)) if summary.config else False,
+                )
+            )
+
+        for datastore in getattr(datacenter, "datastore", []) or []:
+            summary = getattr(datastore, "summary", None)
+            name = getattr(summary, "name", None)
+            if not name:
+                continue
+            datastore_map[name] = VsphereDatastore(
+                name=name,
+                type=getattr(summary, "type", None),
+                capacity_gb=_bytes_to_gb(getattr(summary, "capacity", None)),
+                free_gb=_bytes_to_gb(getattr(summary, "freeSpace", None)),
+            )
+
+        for network in getattr(datacenter, "network", []) or []:
+            name = getattr(network, "name", None)
+            if name:
+                network_names.add(name)
+
+    return VsphereSnapshot(
+        collected_at=datetime.now(timezone.utc),
+        hosts=hosts,
+        virtual_machines=virtual_machines,
+        datastores=list(datastore_map.values()),
+        networks=[VsphereNetwork(name=value) for value in sorted(network_names)],
+    )
+
+
+# Each collector worker keeps its logged-in ServiceInstances between calls, so repeat
+# polls of an endpoint skip the TLS handshake and Login RPC. Workers run one
+# collection at a time, so the cache needs no locking. The password digest is part of
+# the key so a rotated (or mistyped) password is never masked by an older session.
+SESSION_IDLE_SECONDS = 300
+_sessions: Dict[tuple, Tuple[object, float]] = {}
+_sessions_finalizer: Optional[multiprocessing.util.Finalize] = None
+
+
+def _session_key(address: str, port: int, username: str, password: str, verify_ssl: bool) -> tuple:
+    return (address, port, username, hashlib.sha256(password.encode()).digest(), verify_ssl)
+
+
+def _disconnect_quietly(si) -> None:
+    try:
+        Disconnect(si)
+    except Exception:
+        pass
+
+
+def _take_session(key: tuple):
+    now = time.monotonic()
+    for stale_key, (stale_si, last_used) in list(_sessions.items()):
+        if now - last_used > SESSION_IDLE_SECONDS:
+            del _sessions[stale_key]
+            _disconnect_quietly(stale_si)
+    entry = _sessions.pop(key, None)
+    return entry[0] if entry else None
+
+
+def _keep_session(key: tuple, si) -> None:
+    global _sessions_finalizer
+    _sessions[key] = (si, time.monotonic())
+    if _sessions_finalizer is None:
+        # Pool workers exit without running atexit hooks; multiprocessing finalizers do run.
+        _sessions_finalizer = multiprocessing.util.Finalize(None, _close_sessions, exitpriority=10)
+
+
+def _close_sessions() -> None:
+    while _sessions:
+        _, (si, _) = _sessions.popitem()
+        _disconnect_quietly(si)
+
+
 def collect_inventory(
     address: str,
     port: int,
@@ -250,149 +443,82 @@ def collect_inventory(
     password: str,
     verify_ssl: bool,
 ) -> VsphereSnapshot:
+    key = _session_key(address, port, username, password, verify_ssl)
+    si = _take_session(key)
+    if si is not None:
+        try:
+            snapshot = _collect_snapshot(si, address)
+        except Exception:
+            # The server may have expired the cached session; retry below on a fresh login.
+            _disconnect_quietly(si)
+        else:
+            _keep_session(key, si)
+            return snapshot
+
     ssl_context = None
     if not verify_ssl:
         ssl_context = ssl._create_unverified_context()
 
     si = SmartConnect(host=address, user=username, pwd=password, port=port, sslContext=ssl_context)
     try:
-        content = si.RetrieveContent()
-        # apiType is "HostAgent" for a direct ESXi connection, "VirtualCenter" for vCenter.
-        # A direct ESXi host often reports config.name as "localhost.localdomain"; fall back to
-        # the address we connected to (the host's IP) so the UI shows a meaningful identifier.
-        api_type = getattr(getattr(content, "about", None), "apiType", None)
-        is_direct_esxi = api_type == "HostAgent"
-
-        def _resolve_host_name(config_name: Optional[str]) -> str:
-            if is_direct_esxi and (not config_name or str(config_name).strip().lower() in ("localhost.localdomain", "localhost")):
-                return address
-            return config_name or address
-
-        hosts: List[VsphereHost] = []
-        virtual_machines: List[VsphereVirtualMachine] = []
-        datastore_map: dict[str, VsphereDatastore] = {}
-        network_names: Set[str] = set()
-
-        for datacenter in _iter_datacenters(content.rootFolder):
-            host_folder = getattr(datacenter, "hostFolder", None)
-            if host_folder is None:
-                continue
-            for compute_resource in host_folder.childEntity:
-                cluster_name = getattr(compute_resource, "name", None)
-                for esxi_host in getattr(compute_resource, "host", []) or []:
-                    summary = esxi_host.summary
-                    hardware = summary.hardware
-                    quickstats = summary.quickStats
-                    total_bytes = 0
-                    free_bytes = 0
-                    for datastore in getattr(esxi_host, "datastore", []) or []:
-                        ds_summary = datastore.summary
-                        total_bytes += ds_summary.capacity or 0
-                        free_bytes += ds_summary.freeSpace or 0
-
-                    # Determine serial number with fallbacks (systemInfo, summary.otherIdentifyingInfo)
-                    serial_val = getattr(getattr(hardware, "systemInfo", None), "serialNumber", None)
-                    if not serial_val:
-                        # otherIdentifyingInfo can contain vendor-specific identifier tuples
-                        other = getattr(summary.hardware, "otherIdentifyingInfo", None)
-                        if other:
-                            for info in other:
-                                # identifierType may expose label or key that indicates serial/service tag
-                                id_type = getattr(info, "identifierType", None)
-                                label = getattr(id_type, "label", None) or getattr(id_type, "key", None) or ""
-                                if "serial" in str(label).lower() or "service" in str(label).lower():
-                                    serial_val = getattr(info, "identifierValue", None)
-                                    break
-
-                    host_config = getattr(esxi_host, "config", None)
-                    host_net = getattr(host_config, "network", None) if host_config else None
-                    nics, mgmt_ip = _host_nics_and_mgmt(esxi_host, host_net)
-                    portgroups = _host_portgroups(host_net)
-
-                    hosts.append(
-                        VsphereHost(
-                            name=_resolve_host_name(getattr(summary.config, "name", None)),
-                            cluster=cluster_name,
-                            hardware_model=getattr(hardware, "model", None),
-                            serial=serial_val,
-                            connection_state=str(summary.runtime.connectionState) if summary.runtime else "unknown",
-                            power_state=str(summary.runtime.powerState) if summary.runtime else "unknown",
-                            cpu_cores=getattr(hardware, "numCpuCores", None),
-                            cpu_usage_mhz=getattr(quickstats, "overallCpuUsage", None),
-                            memory_total_mb=(getattr(hardware, "memorySize", None) or 0) // (1024 * 1024)
-                            if getattr(hardware, "memorySize", None)
-                            else None,
-                            memory_usage_mb=getattr(quickstats, "overallMemoryUsage", None),
-                            uptime_seconds=getattr(quickstats, "uptime", None),
-                            datastore_total_gb=_bytes_to_gb(total_bytes),
-                            datastore_free_gb=_bytes_to_gb(free_bytes),
-                            vendor=getattr(hardware, "vendor", None),
-                            cpu_model=getattr(hardware, "cpuModel", None),
-                            bios_version=getattr(getattr(hardware, "biosInfo", None), "biosVersion", None),
-                            esxi_version=getattr(getattr(host_config, "product", None), "fullName", None) if host_config else None,
-                            management_ip=mgmt_ip,
-                            nics=nics,
-                            portgroups=portgroups,
-                        )
-                    )
+        snapshot = _collect_snapshot(si, address)
+    except Exception:
+        _disconnect_quietly(si)
+        raise
+    _keep_session(key, si)
+    return snapshot
 
-            vm_folder = getattr(datacenter, "vmFolder", None)
-            if vm_folder is None:
-                continue
-            for entity in _iter_vm_entities(vm_folder):
-                summary = entity.summary
-                quickstats = summary.quickStats
-                storage = getattr(summary, "storage", None)
-                runtime = summary.runtime
-                host_ref = getattr(runtime, "host", None) if runtime else None
-                guest = summary.guest
-
-                vm_datastores = [ds.name for ds in getattr(entity, "datastore", []) or []]
-                vm_networks = [net.name for net in getattr(entity, "network", []) or []]
-
-                virtual_machines.append(
-                    VsphereVirtualMachine(
-                        name=summary.config.name,
-                        host_name=_resolve_host_name(host_ref.name) if host_ref else None,
-                        guest_os=summary.config.guestFullName if summary.config else None,
-                        power_state=str(runtime.powerState) if runtime else "unknown",
-                        ip_address=guest.ipAddress if guest else None,
-                        cpu_count=summary.config.numCpu if summary.config else None,
-                        memory_mb=summary.config.memorySizeMB if summary.config else None,
-                        cpu_usage_mhz=getattr(quickstats, "overallCpuUsage", None),
-                        memory_usage_mb=getattr(quickstats, "guestMemoryUsage", None),
-                        used_storage_gb=_bytes_to_gb(getattr(storage, "committed", None) if storage else None),
-                        provisioned_storage_gb=_bytes_to_gb(getattr(quickstats, "committedStorage", None)),
-                        datastores=vm_datastores,
-                        networks=vm_networks,
-                        tools_status=guest.toolsRunningStatus if guest else None,
-                        is_template=bool(getattr(summary.config, "template", False)) if summary.config else False,
-                    )
-                )
+# pyVmomi spends most of a collection deserializing SOAP responses while holding the
+# GIL, so collections run in worker processes rather than threads to keep the API's
+# event loop responsive during polls and connection tests.
+COLLECT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_collect_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _collect_in_worker(
+    address: str,
+    port: int,
+    username: str,
+    password: str,
+    verify_ssl: bool,
+) -> VsphereSnapshot:
+    try:
+        return collect_inventory(address, port, username, password, verify_ssl)
+    except Exception as exc:
+        # pyVmomi faults do not reliably unpickle in the parent; callers only need the message.
+        raise RuntimeError(str(exc)) from None
 
-            for datastore in getattr(datacenter, "datastore", []) or []:
-                summary = getattr(datastore, "summary", None)
-                name = getattr(summary, "name", None)
-                if not name:
-                    continue
-                datastore_map[name] = VsphereDatastore(
-                    name=name,
-                    type=getattr(summary, "type", None),
-                    capacity_gb=_bytes_to_gb(getattr(summary, "capacity", None)),
-                    free_gb=_bytes_to_gb(getattr(summary, "freeSpace", None)),
-                )
 
-            for network in getattr(datacenter, "network", []) or []:
-                name = getattr(network, "name", None)
-                if name:
-                    network_names.add(name)
-
-        return VsphereSnapshot(
-            collected_at=datetime.now(timezone.utc),
-            hosts=hosts,
-            virtual_machines=virtual_machines,
-            datastores=list(datastore_map.values()),
-            networks=[VsphereNetwork(name=value) for value in sorted(network_names)],
+async def collect_inventory_async(
+    address: str,
+    port: int,
+    username: str,
+    password: str,
+    verify_ssl: bool,
+) -> VsphereSnapshot:
+    """Run :func:`collect_inventory` in the shared worker-process pool."""
+
+    global _collect_pool
+    if _collect_pool is None:
+        # spawn, not fork: the parent runs an event loop and database driver threads.
+        _collect_pool = ProcessPoolExecutor(
+            max_workers=COLLECT_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
         )
-    finally:
-        Disconnect(si)
\ No newline at end of file
+    pool = _collect_pool
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, _collect_in_worker, address, port, username, password, verify_ssl)
+    except BrokenProcessPool:
+        # A crashed worker poisons the pool; start a fresh one on the next call.
+        if _collect_pool is pool:
+            _collect_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def shutdown_collect_pool() -> None:
+    global _collect_pool
+    if _collect_pool is not None:
+        _collect_pool.shutdown(wait=False, cancel_futures=True)
+        _collect_pool = None
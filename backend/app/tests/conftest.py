@@ -16,6 +16,7 @@ class TestSettings(Settings):
     password_salt: str = "test-salt"
     fernet_key: str = "Z3VsbGl2ZXJzLXJvY2stY2Fja2xlLXNhbHQtMTIzNDU2Nzg5MDEyMzQ1Ng=="
     cors_origins: List[str] = ["http://localhost"]
+    strict_orm_loading: bool = True
 
 
 @pytest.fixture(scope="session")
@@ -30,21 +31,25 @@ def override_settings() -> AsyncIterator[None]:
     original_settings = get_settings()
     original_engine = database.engine
     original_session_factory = database.AsyncSessionLocal
+    original_auth_engine = database.auth_engine
+    original_auth_session_factory = database.AuthSessionLocal
     original_settings_obj = database.settings
 
     test_settings = TestSettings()
 
     app.dependency_overrides[get_settings] = lambda: test_settings
-    get_settings.cache_clear()
     database.settings = test_settings
     database.engine = database.build_engine(test_settings.database_url)
     database.AsyncSessionLocal = async_sessionmaker(bind=database.engine, expire_on_commit=False)
+    database.auth_engine = database.build_auth_engine(test_settings.database_url, database.engine)
+    database.AuthSessionLocal = async_sessionmaker(bind=database.auth_engine, expire_on_commit=False)
     yield
     app.dependency_overrides.pop(get_settings, None)
-    get_settings.cache_clear()
     database.settings = original_settings
     database.engine = original_engine
     database.AsyncSessionLocal = original_session_factory
+    database.auth_engine = original_auth_engine
+    database.AuthSessionLocal = original_auth_session_factory
 
 
 @pytest.fixture(autouse=True)
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import delete
+from sqlalchemy import delete, insert
 
 from app.core import database
 from app.core.security import get_password_hash
@@ -12,6 +12,8 @@ from app.models import (
     AciFabricNodeDetail,
     AciFabricNodeInterface,
     AciNodeRole,
+    TelcoFabricOnboardingJob,
+    TelcoFabricType,
     User,
     UserRoleEnum,
 )
@@ -236,6 +238,8 @@ async def test_fabric_summary_details(async_client: AsyncClient, admin_user: Use
     assert first_fabric["by_role"].get("leaf") == 20
     assert first_fabric["by_role"].get("spine") == 5
     assert first_fabric["by_role"].get("controller") == 5
+    assert list(first_fabric["by_role"]) == ["leaf", "controller", "spine"]
+    assert list(first_fabric["by_model"]) == ["N9K-C93180YC-FX", "APIC-SERVER", "N9K-C9508"]
 
     leaves_only = await async_client.get(
         "/api/v1/aci/fabric/summary/details",
@@ -247,6 +251,47 @@ async def test_fabric_summary_details(async_client: AsyncClient, admin_user: Use
     assert leaves_data["total_nodes"] == 20
     assert leaves_data["fabrics"][0]["by_role"].get("leaf") == 20
 
+    spines_by_model = await async_client.get(
+        "/api/v1/aci/fabric/summary/details",
+        params={"models": ["n9k-c9508"], "fabric": "unassigned"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert spines_by_model.status_code == 200
+    spines_data = spines_by_model.json()
+    assert spines_data["total_nodes"] == 5
+    assert spines_data["fabrics"][0]["by_model"] == {"N9K-C9508": 5}
+    assert spines_data["fabrics"][0]["by_fabric_state"] == {"unknown": 5}
+    assert "N9K-C93180YC-FX" in spines_data["available_models"]
+
+    no_match = await async_client.get(
+        "/api/v1/aci/fabric/summary/details",
+        params={"fabric": "does-not-exist"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert no_match.status_code == 200
+    assert no_match.json()["total_nodes"] == 0
+    assert no_match.json()["fabrics"] == []
+
+
+@pytest.mark.anyio("asyncio")
+async def test_fabric_summary(async_client: AsyncClient, admin_user: User, populate_fabric_nodes: None) -> None:
+    token = await _login(async_client, admin_user.email, "adminpass")
+
+    response = await async_client.get(
+        "/api/v1/aci/fabric/summary",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 30
+    assert data["leaf_count"] == 20
+    assert data["spine_count"] == 5
+    assert data["controller_count"] == 5
+    assert data["unspecified_count"] == 0
+    assert data["delayed_heartbeat"] == 0
+    assert data["by_fabric_state"] == {"unknown": 30}
+    assert data["by_version"] == {"5.2(2)": 5, "5.2(3)": 20, "5.2(3a)": 5}
+
 
 @pytest.mark.anyio("asyncio")
 async def test_get_fabric_node_detail(async_client: AsyncClient, admin_user: User, node_with_detail: AciFabricNode) -> None:
@@ -277,4 +322,68 @@ async def test_list_fabric_node_interfaces(async_client: AsyncClient, admin_user
     assert len(data) == 1
     assert data[0]["name"] == "eth1/1"
     assert data[0]["epg_bindings"] == []
-    assert data[0]["l3out_bindings"] == []
\ No newline at end of file
+    assert data[0]["l3out_bindings"] == []
+
+
+@pytest.mark.anyio("asyncio")
+async def test_fabric_summary_details_reflect_committed_writes(async_client: AsyncClient, admin_user: User) -> None:
+    token = await _login(async_client, admin_user.email, "adminpass")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with database.AsyncSessionLocal() as session:
+        job = TelcoFabricOnboardingJob(name="fabric-a", fabric_type=TelcoFabricType.ACI, target_host="10.1.1.1")
+        session.add(job)
+        await session.flush()
+        session.add(
+            AciFabricNode(
+                distinguished_name="topology/pod-1/node-101",
+                name="leaf-101",
+                role=AciNodeRole.LEAF,
+                node_id="101",
+                fabric_job_id=job.id,
+            )
+        )
+        await session.commit()
+
+    first = await async_client.get("/api/v1/aci/fabric/summary/details", headers=headers)
+    assert first.status_code == 200
+    assert [fabric["fabric_name"] for fabric in first.json()["fabrics"]] == ["fabric-a"]
+
+    async with database.AsyncSessionLocal() as session:
+        stored_job = await session.get(TelcoFabricOnboardingJob, job.id)
+        stored_job.name = "fabric-b"
+        await session.commit()
+
+    renamed = await async_client.get("/api/v1/aci/fabric/summary/details", headers=headers)
+    assert [fabric["fabric_name"] for fabric in renamed.json()["fabrics"]] == ["fabric-b"]
+
+    async with database.AsyncSessionLocal() as session:
+        session.add(
+            AciFabricNode(
+                distinguished_name="topology/pod-1/node-102",
+                name="leaf-102",
+                role=AciNodeRole.LEAF,
+                node_id="102",
+                fabric_job_id=job.id,
+            )
+        )
+        await session.commit()
+
+    grown = await async_client.get("/api/v1/aci/fabric/summary/details", headers=headers)
+    assert grown.json()["total_nodes"] == 2
+
+    async with database.AsyncSessionLocal() as session:
+        await session.execute(
+            insert(AciFabricNode).values(
+                id=uuid.uuid4(),
+                distinguished_name="topology/pod-1/node-103",
+                name="leaf-103",
+                role=AciNodeRole.LEAF,
+                node_id="103",
+                fabric_job_id=job.id,
+            )
+        )
+        await session.commit()
+
+    bulk_inserted = await async_client.get("/api/v1/aci/fabric/summary/details", headers=headers)
+    assert bulk_inserted.json()["total_nodes"] == 3
@@ -73,3 +73,43 @@ async def test_register_user(async_client: AsyncClient, admin_user: User):
         created_user = result.scalar_one_or_none()
         assert created_user is not None
         assert created_user.role == UserRoleEnum.USER
+
+
+@pytest.mark.anyio("asyncio")
+async def test_cached_token_rejected_after_user_deleted(async_client: AsyncClient, admin_user: User):
+    login_resp = await async_client.post(
+        "/api/v1/auth/login",
+        data={"username": admin_user.email, "password": "adminpass"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+    assert (await async_client.get("/api/v1/auth/me", headers=headers)).status_code == 200
+
+    async with database.AsyncSessionLocal() as session:
+        user = await session.get(User, admin_user.id)
+        await session.delete(user)
+        await session.commit()
+
+    assert (await async_client.get("/api/v1/auth/me", headers=headers)).status_code == 401
+
+
+@pytest.mark.anyio("asyncio")
+async def test_blank_password_update_keeps_existing_hash(async_client: AsyncClient, admin_user: User):
+    login_resp = await async_client.post(
+        "/api/v1/auth/login",
+        data={"username": admin_user.email, "password": "adminpass"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+
+    response = await async_client.patch(
+        f"/api/v1/users/{admin_user.id}",
+        json={"password": "", "full_name": "Renamed Admin"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Renamed Admin"
+
+    async with database.AsyncSessionLocal() as session:
+        stored = await session.get(User, admin_user.id)
+        assert stored.hashed_password == admin_user.hashed_password
@@ -0,0 +1,217 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core import database
+from app.core.security import get_password_hash
+from app.models import (
+    InventoryEndpoint,
+    InventoryEndpointStatus,
+    InventoryHost,
+    InventorySyncJob,
+    InventorySyncJobStatus,
+    User,
+    UserRoleEnum,
+)
+from app.services.crypto import encrypt_secret
+from app.services.inventory_poller import PollResult
+
+
+@pytest.fixture
+async def admin_user() -> User:
+    async with database.AsyncSessionLocal() as session:
+        user = User(
+            id=uuid.uuid4(),
+            email="admin-inventory@example.com",
+            full_name="Inventory Admin",
+            hashed_password=get_password_hash("adminpass"),
+            role=UserRoleEnum.ADMIN,
+        )
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+        return user
+
+
+@pytest.fixture
+async def endpoint() -> InventoryEndpoint:
+    async with database.AsyncSessionLocal() as session:
+        endpoint = InventoryEndpoint(
+            name="vcenter-lab",
+            address="vcenter.example.com",
+            username="administrator@vsphere.local",
+            password_secret=encrypt_secret("secret"),
+        )
+        session.add(endpoint)
+        await session.commit()
+        return endpoint
+
+
+async def _login(client: AsyncClient, email: str, password: str) -> str:
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": email, "password": password},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_sync_job_completes(
+    async_client: AsyncClient,
+    admin_user: User,
+    endpoint: InventoryEndpoint,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _fake_poll(session, polled_endpoint):  # noqa: ANN001
+        return PollResult(status=InventoryEndpointStatus.OK, message="Inventory synchronized")
+
+    monkeypatch.setattr("app.routers.inventory.run_poll_for_endpoint", _fake_poll)
+    token = await _login(async_client, admin_user.email, "adminpass")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await async_client.post(f"/api/v1/inventory/endpoints/{endpoint.id}/sync", headers=headers)
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "pending"
+
+    job_response = await async_client.get(f"/api/v1/inventory/sync-jobs/{job['id']}", headers=headers)
+    assert job_response.status_code == 200
+    data = job_response.json()
+    assert data["status"] == "done"
+    assert data["summary"]["message"] == "Inventory synchronized"
+    assert data["finished_at"] is not None
+
+
+@pytest.mark.anyio("asyncio")
+async def test_sync_job_records_failure(
+    async_client: AsyncClient,
+    admin_user: User,
+    endpoint: InventoryEndpoint,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _failing_poll(session, polled_endpoint):  # noqa: ANN001
+        raise RuntimeError("vCenter unreachable")
+
+    monkeypatch.setattr("app.routers.inventory.run_poll_for_endpoint", _failing_poll)
+    token = await _login(async_client, admin_user.email, "adminpass")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await async_client.post(f"/api/v1/inventory/endpoints/{endpoint.id}/sync", headers=headers)
+    assert response.status_code == 202
+
+    job_response = await async_client.get(f"/api/v1/inventory/sync-jobs/{response.json()['id']}", headers=headers)
+    assert job_response.status_code == 200
+    data = job_response.json()
+    assert data["status"] == "error"
+    assert data["error_message"] == "vCenter unreachable"
+
+
+@pytest.mark.anyio("asyncio")
+async def test_orphaned_sync_jobs_expire_and_are_pruned(
+    async_client: AsyncClient,
+    admin_user: User,
+    endpoint: InventoryEndpoint,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _fake_poll(session, polled_endpoint):  # noqa: ANN001
+        return PollResult(status=InventoryEndpointStatus.OK, message=None)
+
+    monkeypatch.setattr("app.routers.inventory.run_poll_for_endpoint", _fake_poll)
+    now = datetime.now(timezone.utc)
+    async with database.AsyncSessionLocal() as session:
+        orphaned = InventorySyncJob(
+            endpoint_id=endpoint.id,
+            status=InventorySyncJobStatus.RUNNING,
+            created_at=now - timedelta(hours=1),
+        )
+        abandoned = InventorySyncJob(
+            endpoint_id=endpoint.id,
+            status=InventorySyncJobStatus.PENDING,
+            created_at=now - timedelta(hours=1),
+        )
+        # Queued long ago but only just started polling: still within the cutoff.
+        long_running = InventorySyncJob(
+            endpoint_id=endpoint.id,
+            status=InventorySyncJobStatus.RUNNING,
+            created_at=now - timedelta(hours=1),
+            started_at=now - timedelta(minutes=1),
+        )
+        expired = InventorySyncJob(
+            endpoint_id=endpoint.id,
+            status=InventorySyncJobStatus.DONE,
+            created_at=now - timedelta(days=30),
+        )
+        session.add_all([orphaned, abandoned, long_running, expired])
+        await session.commit()
+
+    token = await _login(async_client, admin_user.email, "adminpass")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    job_response = await async_client.get(f"/api/v1/inventory/sync-jobs/{orphaned.id}", headers=headers)
+    assert job_response.status_code == 200
+    assert job_response.json()["status"] == "error"
+
+    response = await async_client.post(f"/api/v1/inventory/endpoints/{endpoint.id}/sync", headers=headers)
+    assert response.status_code == 202
+
+    async with database.AsyncSessionLocal() as session:
+        remaining = dict((await session.execute(select(InventorySyncJob.id, InventorySyncJob.status))).all())
+    assert expired.id not in remaining
+    assert remaining[orphaned.id] == InventorySyncJobStatus.ERROR
+    assert remaining[abandoned.id] == InventorySyncJobStatus.ERROR
+    assert remaining[long_running.id] == InventorySyncJobStatus.RUNNING
+
+    long_running_response = await async_client.get(f"/api/v1/inventory/sync-jobs/{long_running.id}", headers=headers)
+    assert long_running_response.json()["status"] == "running"
+
+
+@pytest.mark.anyio("asyncio")
+async def test_host_cursor_pagination_covers_every_row(
+    async_client: AsyncClient,
+    admin_user: User,
+) -> None:
+    # Same names (one per endpoint) force the id tie-breaker; a shared id prefix
+    # catches ids that compare in a different form than the ORDER BY sees them.
+    async with database.AsyncSessionLocal() as session:
+        for idx in range(7):
+            host_endpoint = InventoryEndpoint(
+                name=f"vcenter-{idx}",
+                address=f"vcenter-{idx}.example.com",
+                username="administrator@vsphere.local",
+                password_secret=encrypt_secret("secret"),
+            )
+            session.add(host_endpoint)
+            await session.flush()
+            session.add(
+                InventoryHost(
+                    id=uuid.UUID(f"abcdef12-0000-4000-8000-{idx:012d}"),
+                    endpoint_id=host_endpoint.id,
+                    name="same",
+                )
+            )
+        await session.commit()
+
+    token = await _login(async_client, admin_user.email, "adminpass")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    full = await async_client.get("/api/v1/inventory/hosts", headers=headers)
+    assert full.status_code == 200
+
+    paged: list[str] = []
+    params: dict[str, object] = {"limit": 2}
+    while True:
+        page = await async_client.get("/api/v1/inventory/hosts", params=params, headers=headers)
+        assert page.status_code == 200
+        paged.extend(item["id"] for item in page.json())
+        next_cursor = page.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+
+    assert len(paged) == 7
+    assert paged == [item["id"] for item in full.json()]
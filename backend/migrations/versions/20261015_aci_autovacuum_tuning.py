@@ -0,0 +1,39 @@
+"""Vacuum the churny ACI node/endpoint/VLAN tables more eagerly on PostgreSQL
+
+Every poll rewrites a fabric's nodes and replaces its endpoints and VLANs. A
+lower autovacuum scale factor keeps the visibility map fresh, so the list
+endpoints' COUNT(id) can use index-only scans. Other databases are left
+untouched.
+
+Revision ID: 20261015_aci_autovacuum_tuning
+Revises: 20261015_aci_node_name_index
+Create Date: 2026-10-15 17:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_aci_autovacuum_tuning"
+down_revision = "20261015_aci_node_name_index"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+TABLES = ("aci_fabric_nodes", "aci_fabric_endpoints", "aci_fabric_vlans")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        op.execute(sa.text(f"ALTER TABLE {table} SET (autovacuum_vacuum_scale_factor = 0.02)"))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        op.execute(sa.text(f"ALTER TABLE {table} RESET (autovacuum_vacuum_scale_factor)"))
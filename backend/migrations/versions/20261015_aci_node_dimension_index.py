@@ -0,0 +1,32 @@
+"""Add a covering index for the ACI summary filter choices
+
+The fabric summary details read SELECT DISTINCT role, model, version,
+fabric_state (optionally filtered by role); a covering index lets that run as
+an index-only scan instead of a full table scan.
+
+Revision ID: 20261015_aci_node_dimension_idx
+Revises: 20261015_sys_cred_system_idx
+Create Date: 2026-10-15 19:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261015_aci_node_dimension_idx"
+down_revision = "20261015_sys_cred_system_idx"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+TABLE_NAME = "aci_fabric_nodes"
+INDEX_NAME = "ix_aci_node_role_model_version_state"
+
+
+def upgrade() -> None:
+    op.create_index(INDEX_NAME, TABLE_NAME, ["role", "model", "version", "fabric_state"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
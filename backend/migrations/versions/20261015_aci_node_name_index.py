@@ -0,0 +1,30 @@
+"""Index aci_fabric_nodes.name for the name-ordered node listings
+
+The node list pages with ORDER BY name LIMIT/OFFSET; without an index every
+page sorts the whole table.
+
+Revision ID: 20261015_aci_node_name_index
+Revises: 20261015_aci_node_search_trgm
+Create Date: 2026-10-15 16:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261015_aci_node_name_index"
+down_revision = "20261015_aci_node_search_trgm"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+TABLE_NAME = "aci_fabric_nodes"
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_aci_fabric_nodes_name"), TABLE_NAME, ["name"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_aci_fabric_nodes_name"), table_name=TABLE_NAME)
@@ -0,0 +1,54 @@
+"""Add pg_trgm indexes for the ACI fabric node search
+
+The node search matches ``col ILIKE '%term%'``, which a btree cannot serve. On
+PostgreSQL, trigram GIN indexes on the searched columns (gin_trgm_ops serves
+ILIKE directly) let the planner avoid a sequential scan. Other databases are
+left untouched.
+
+Revision ID: 20261015_aci_node_search_trgm
+Revises: 20260730_merge_heads
+Create Date: 2026-10-15 14:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261015_aci_node_search_trgm"
+down_revision = "20260730_merge_heads"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+# (index name, table, column) - the columns searched by ``list_fabric_nodes``.
+TRGM_INDEXES = (
+    ("ix_aci_nodes_name_trgm", "aci_fabric_nodes", "name"),
+    ("ix_aci_nodes_address_trgm", "aci_fabric_nodes", "address"),
+    ("ix_aci_nodes_serial_trgm", "aci_fabric_nodes", "serial"),
+    ("ix_aci_nodes_model_trgm", "aci_fabric_nodes", "model"),
+    ("ix_aci_nodes_site_name_trgm", "aci_fabric_nodes", "site_name"),
+    ("ix_aci_nodes_rack_location_trgm", "aci_fabric_nodes", "rack_location"),
+    ("ix_aci_nodes_version_trgm", "aci_fabric_nodes", "version"),
+    ("ix_aci_nodes_fabric_state_trgm", "aci_fabric_nodes", "fabric_state"),
+    ("ix_aci_nodes_pod_trgm", "aci_fabric_nodes", "pod"),
+    ("ix_aci_nodes_dn_trgm", "aci_fabric_nodes", "distinguished_name"),
+    ("ix_telco_jobs_name_trgm", "telco_fabric_onboarding_jobs", "name"),
+    ("ix_telco_jobs_target_host_trgm", "telco_fabric_onboarding_jobs", "target_host"),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for name, table, column in TRGM_INDEXES:
+        op.execute(sa.text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)"))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name, _, _ in reversed(TRGM_INDEXES):
+        op.execute(sa.text(f"DROP INDEX IF EXISTS {name}"))
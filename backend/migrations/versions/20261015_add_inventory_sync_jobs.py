@@ -0,0 +1,52 @@
+"""Add inventory_sync_jobs for background endpoint syncs
+
+POST /inventory/endpoints/{id}/sync now records a job row and polls after the
+response is sent; clients follow it through GET /inventory/sync-jobs/{id}.
+
+Revision ID: 20261015_add_inventory_sync_jobs
+Revises: 20261015_inv_vm_host_name_idx
+Create Date: 2026-10-15 21:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.types import GUID
+
+
+revision = "20261015_add_inventory_sync_jobs"
+down_revision = "20261015_inv_vm_host_name_idx"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+TABLE_NAME = "inventory_sync_jobs"
+# Member names, matching how the models' Enum columns are stored.
+sync_job_status_enum = sa.Enum("PENDING", "RUNNING", "DONE", "ERROR", name="inventorysyncjobstatus")
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE_NAME,
+        sa.Column("id", GUID(), primary_key=True),
+        sa.Column(
+            "endpoint_id",
+            GUID(),
+            sa.ForeignKey("inventory_endpoints.id", ondelete="CASCADE"),
+            nullable=False,
+            index=True,
+        ),
+        sa.Column("status", sync_job_status_enum, nullable=False, server_default="PENDING"),
+        sa.Column("summary", sa.JSON(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE_NAME)
+    sync_job_status_enum.drop(op.get_bind(), checkfirst=True)
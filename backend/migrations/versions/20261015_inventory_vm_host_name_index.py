@@ -0,0 +1,32 @@
+"""Index inventory VMs by (host_id, name) for host-filtered listings
+
+The VM list filters by host and orders by name. The per-endpoint variants
+are already served by the (endpoint_id, name) unique constraints on every
+inventory table; this covers the host filter the same way.
+
+Revision ID: 20261015_inv_vm_host_name_idx
+Revises: 20261015_aci_node_dimension_idx
+Create Date: 2026-10-15 20:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261015_inv_vm_host_name_idx"
+down_revision = "20261015_aci_node_dimension_idx"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+TABLE_NAME = "inventory_virtual_machines"
+INDEX_NAME = "ix_inventory_vm_host_name"
+
+
+def upgrade() -> None:
+    op.create_index(INDEX_NAME, TABLE_NAME, ["host_id", "name"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
@@ -0,0 +1,30 @@
+"""Index system_credentials.system_id
+
+Every credentials loader (systems list, GUI token, terminal) selects by
+system_id, which had no index.
+
+Revision ID: 20261015_sys_cred_system_idx
+Revises: 20261015_aci_autovacuum_tuning
+Create Date: 2026-10-15 18:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261015_sys_cred_system_idx"
+down_revision = "20261015_aci_autovacuum_tuning"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+TABLE_NAME = "system_credentials"
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_system_credentials_system_id"), TABLE_NAME, ["system_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_system_credentials_system_id"), table_name=TABLE_NAME)
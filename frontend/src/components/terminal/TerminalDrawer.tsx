@@ -39,13 +39,15 @@ export function TerminalDrawer({ open, systemName, systemId, token, onClose }: T
 
     const socketUrl = buildTerminalUrl(systemId, token);
     const socket = new WebSocket(socketUrl);
+    socket.binaryType = "arraybuffer";
 
     socket.onopen = () => {
       term.write(`\x1b[32mConnected to ${systemName}\x1b[0m\r\n`);
     };
 
     socket.onmessage = (event) => {
-      term.write(event.data);
+      // Shell output arrives as raw bytes; server status messages are text.
+      term.write(typeof event.data === "string" ? event.data : new Uint8Array(event.data));
     };
 
     socket.onclose = () => {
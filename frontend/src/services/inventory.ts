@@ -9,6 +9,7 @@ import {
   InventoryHostNic,
   InventoryNetwork,
   InventorySourceType,
+  InventorySyncJob,
   InventoryVirtualMachine,
   InventoryVmTopology
 } from "@/types";
@@ -35,6 +36,11 @@ export const fetchInventoryEndpoints = async (): Promise<InventoryEndpoint[]> =>
   return data;
 };
 
+export const fetchInventoryEndpoint = async (id: string): Promise<InventoryEndpoint> => {
+  const { data } = await api.get<InventoryEndpoint>(`/inventory/endpoints/${id}`);
+  return data;
+};
+
 export const createInventoryEndpoint = async (
   payload: CreateInventoryEndpointPayload
 ): Promise<InventoryEndpoint> => {
@@ -126,7 +132,29 @@ export const testInventoryEndpoint = async (id: string): Promise<InventoryEndpoi
   return data;
 };
 
-export const syncInventoryEndpoint = async (id: string): Promise<InventoryEndpointSyncResponse> => {
-  const { data } = await api.post<InventoryEndpointSyncResponse>(`/inventory/endpoints/${id}/sync`, {});
+const SYNC_JOB_POLL_MS = 1500;
+// Matches the server's stale-job cutoff; stop waiting on a job that will never finish.
+const SYNC_JOB_MAX_WAIT_MS = 15 * 60 * 1000;
+
+export const fetchInventorySyncJob = async (jobId: string): Promise<InventorySyncJob> => {
+  const { data } = await api.get<InventorySyncJob>(`/inventory/sync-jobs/${jobId}`);
   return data;
+};
+
+// The sync runs server-side after the POST returns; wait for the job to finish.
+export const syncInventoryEndpoint = async (id: string): Promise<InventoryEndpointSyncResponse> => {
+  let { data: job } = await api.post<InventorySyncJob>(`/inventory/endpoints/${id}/sync`, {});
+  const deadline = Date.now() + SYNC_JOB_MAX_WAIT_MS;
+  while (job.status === "pending" || job.status === "running") {
+    if (Date.now() >= deadline) {
+      throw new Error("Timed out waiting for the endpoint sync to finish");
+    }
+    await new Promise((resolve) => setTimeout(resolve, SYNC_JOB_POLL_MS));
+    job = await fetchInventorySyncJob(job.id);
+  }
+  if (job.status === "error" || !job.summary) {
+    throw new Error(job.error_message || "Unable to sync endpoint");
+  }
+  const endpoint = await fetchInventoryEndpoint(id);
+  return { endpoint, summary: job.summary };
 };
\ No newline at end of file
@@ -171,6 +171,19 @@ export interface InventoryEndpointSyncResponse {
   summary: InventoryEndpointValidationResult;
 }
 
+export type InventorySyncJobStatus = "pending" | "running" | "done" | "error";
+
+export interface InventorySyncJob {
+  id: string;
+  endpoint_id: string;
+  status: InventorySyncJobStatus;
+  summary?: InventoryEndpointValidationResult | null;
+  error_message?: string | null;
+  started_at?: string | null;
+  finished_at?: string | null;
+  created_at: string;
+}
+
 export type AciNodeRole = "leaf" | "spine" | "controller" | "unspecified";
 
 export interface AciFabricNode {